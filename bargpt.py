@@ -0,0 +1,210 @@
+import argparse
+import random
+import tkinter as tk
+
+try:
+    import numpy as np
+except ImportError:  # only needed by this rendering mode
+    np = None
+
+from opsgpt import COMPARE_MODES, OpStats, coalesce_frames
+from sortsgpt import SORTS, OpStream
+
+# Rendering settings
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 400
+ARRAY_SIZE = 100000
+OPS_PER_FRAME = 1000  # recorded operations applied between two frames
+DELAY = 1  # ms between frames
+STATUS_EVERY = 20  # frames between updates of the op stats line
+
+# Palette: the image stores an index into this list for every pixel
+PALETTE = ["#000000", "#ffffff", "#808080", "#ff0000", "#008000", "#0000ff"]
+BG, FG, SPREAD = 0, 1, 2  # background, bars, spread between a column's min and max
+HIGHLIGHTS = {"red": 3, "green": 4, "blue": 5}
+
+
+class BarColumns:
+    """
+    Draws an array as vertical bars, one pixel column per bucket of elements:
+    each column is solid up to the smallest value in its bucket and shaded up
+    to the largest one. paint() returns the columns as palette indices; the
+    subclasses put them on screen.
+    """
+
+    def __init__(self, size, width=CANVAS_WIDTH, height=CANVAS_HEIGHT):
+        if np is None:
+            raise RuntimeError("The image rendering mode needs NumPy (pip install numpy)")
+        self.width = width
+        self.height = height
+        # Column c shows elements lo[c] <= i < hi[c]; with fewer elements
+        # than columns an element spans several columns instead.
+        columns = np.arange(width + 1)
+        bounds = columns * size // width
+        self.lo = bounds[:-1]
+        self.hi = np.maximum(bounds[1:], self.lo + 1)
+        self.rows = np.arange(height)[:, None]
+
+    def column_ranges(self, indices):
+        # For every element index, the range of columns that show it
+        indices = np.asarray(indices)
+        first = np.searchsorted(self.lo, indices, "left")
+        last = np.searchsorted(self.lo, indices, "right")
+        return [range(min(f, l - 1), l) for f, l in zip(first.tolist(), last.tolist())]
+
+    def columns_of(self, indices):
+        # Every column that shows one of the given element indices
+        return {c for columns in self.column_ranges(indices) for c in columns}
+
+    def highlight_columns(self, highlights):
+        # Element index -> color name, to column -> palette index
+        highlighted = {}
+        if highlights:
+            for columns, color in zip(self.column_ranges(list(highlights)), highlights.values()):
+                for column in columns:
+                    highlighted[column] = HIGHLIGHTS.get(color, FG)
+        return highlighted
+
+    def paint(self, values, x0, x1, highlighted):
+        """
+        Returns columns x0 <= column < x1 as a height x (x1 - x0) array of
+        palette indices. values must be a NumPy array.
+        """
+        # Min/max of every column, from one slice of the array
+        lo = self.lo[x0:x1]
+        start = lo[0]
+        chunk = values[start:self.hi[x1 - 1]]
+        offsets = lo - start
+        column_min = np.minimum.reduceat(chunk, offsets)
+        column_max = np.maximum.reduceat(chunk, offsets)
+
+        color = np.array([highlighted.get(c, FG) for c in range(x0, x1)])
+        top_max = self.height - np.clip(column_max, 0, self.height)
+        top_min = self.height - np.clip(column_min, 0, self.height)
+        # Highlighted columns are filled up to their max
+        top_solid = np.where(color != FG, top_max, top_min)
+        return np.where(self.rows >= top_solid, color, np.where(self.rows >= top_max, SPREAD, BG))
+
+
+class BarImage(BarColumns):
+    """
+    Draws an array as bars into a single PhotoImage instead of one canvas
+    rectangle per element. Only the columns touched since the last frame are
+    repainted and copied into the image.
+    """
+
+    def __init__(self, canvas, size, width=CANVAS_WIDTH, height=CANVAS_HEIGHT):
+        super().__init__(size, width, height)
+        self.photo = tk.PhotoImage(width=width, height=height)
+        canvas.create_image(0, 0, image=self.photo, anchor="nw")
+        # Each palette color as the 8 bytes "#rrggbb " of PhotoImage.put()'s data
+        self.palette = np.array([list((color + " ").encode()) for color in PALETTE], dtype=np.uint8)
+        self.highlighted = {}  # column -> palette index, as drawn in the last frame
+
+    def draw(self, values, highlights=None, changed=None):
+        """
+        Repaints the columns showing the changed element indices (all of them
+        if changed is None) plus the columns highlighted now or in the last frame.
+        values must be a NumPy array; highlights maps indices to color names.
+        """
+        highlighted = self.highlight_columns(highlights)
+        if changed is None:
+            dirty = range(self.width)
+        else:
+            dirty = set(self.highlighted) | set(highlighted)
+            if len(changed):
+                dirty |= self.columns_of(list(changed))
+            dirty = sorted(dirty)
+        self.highlighted = highlighted
+
+        # Repaint and blit each run of neighbouring dirty columns in one go
+        run_start = None
+        previous = None
+        for column in dirty:
+            if run_start is None:
+                run_start = column
+            elif column != previous + 1:
+                self.blit(values, run_start, previous + 1)
+                run_start = column
+            previous = column
+        if run_start is not None:
+            self.blit(values, run_start, previous + 1)
+
+    def blit(self, values, x0, x1):
+        pixels = self.paint(values, x0, x1, self.highlighted)
+
+        # Build the "{#rrggbb ...} {...} ..." rows with array ops rather than string joins
+        height, width = pixels.shape
+        data = np.empty((height, width * 8 + 3), dtype=np.uint8)
+        data[:, 0] = ord("{")
+        data[:, 1:-2] = self.palette[pixels].reshape(height, width * 8)
+        data[:, -2] = ord("}")
+        data[:, -1] = ord(" ")
+        self.photo.put(data.tobytes().decode("ascii"), to=(int(x0), 0))
+
+
+class ImageSortVisualizer:
+    def __init__(self, root, algorithm, size=ARRAY_SIZE, ops_per_frame=OPS_PER_FRAME, compares="keep"):
+        self.root = root
+        self.algorithm = algorithm
+        self.size = size
+        self.ops_per_frame = ops_per_frame
+        self.compares = compares
+        root.title(f"{algorithm} ({size} elements)")
+        self.canvas = tk.Canvas(root, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, bg="black", highlightthickness=0)
+        self.canvas.pack()
+        self.status = tk.Label(root, font=("Helvetica", 10))
+        self.status.pack()
+        button = tk.Button(root, text="Reset", command=self.reset)
+        button.pack(pady=10)
+        self.bars = BarImage(self.canvas, size)
+        self.after_id = None
+        self.ops = None
+        self.reset()
+
+    def reset(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        if self.ops is not None:
+            self.ops.close()
+        array = [random.randint(10, CANVAS_HEIGHT) for _ in range(self.size)]
+        self.values = np.array(array, dtype=np.int32)
+        # The ops are streamed from the sort while it runs, then reach the
+        # image as per-frame sets of changed elements
+        self.ops = OpStream(SORTS[self.algorithm].generate, list(array))
+        self.stats = OpStats()
+        self.frames = coalesce_frames(array, self.ops, self.ops_per_frame, self.compares, stats=self.stats)
+        self.status.config(text="")
+        self.bars.draw(self.values)
+        self.after_id = self.root.after(DELAY, self.animate)
+
+    def animate(self):
+        frame = next(self.frames, None)
+        if frame is None:
+            self.bars.draw(self.values, changed=())
+            self.status.config(text=str(self.stats))
+            self.after_id = None
+            return
+        writes, highlights = frame
+        if writes:
+            self.values[list(writes)] = list(writes.values())
+        self.bars.draw(self.values, highlights, writes.keys())
+        if self.stats.frames % STATUS_EVERY == 0:
+            self.status.config(text=str(self.stats))
+        self.after_id = self.root.after(DELAY, self.animate)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Animate a sort of a large array, drawn into a single image.")
+    parser.add_argument("algorithm", choices=sorted(SORTS))
+    parser.add_argument("--size", type=int, default=ARRAY_SIZE, help="number of elements")
+    parser.add_argument("--ops-per-frame", type=int, default=OPS_PER_FRAME, help="operations applied per frame")
+    parser.add_argument("--compares", choices=COMPARE_MODES, default="keep", help="what to do with compare ops")
+    args = parser.parse_args()
+    root = tk.Tk()
+    ImageSortVisualizer(root, args.algorithm, args.size, args.ops_per_frame, args.compares)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
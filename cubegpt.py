@@ -68,16 +68,25 @@ class Cube3D:
 
 
 class Engine3D:
-    def __init__(self, root):
+    def __init__(self, root=None, canvas=None):
         self.root = root
+        self.cube = Cube3D()
+        if root is None:
+            # Headless engine: draws on the given canvas when draw() is called
+            self.canvas = canvas
+            return
         self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="black")
         self.canvas.pack()
-        self.cube = Cube3D()
         self.animate()
 
     def animate(self):
-        self.canvas.delete("all")
         self.cube.rotate()
+        self.draw()
+        # Schedule the next frame.
+        self.root.after(20, self.animate)
+
+    def draw(self):
+        self.canvas.delete("all")
         # Get rotated vertices.
         vertices = self.cube.get_rotated_vertices()
         # Project 3D vertices to 2D screen coordinates.
@@ -87,8 +96,6 @@ class Engine3D:
             p1 = projected_points[edge[0]]
             p2 = projected_points[edge[1]]
             self.canvas.create_line(p1[0], p1[1], p2[0], p2[1], fill="white", width=2)
-        # Schedule the next frame.
-        self.root.after(20, self.animate)
 
 
 if __name__ == '__main__':
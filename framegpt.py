@@ -0,0 +1,480 @@
+import argparse
+import os
+import queue
+import random
+import shlex
+import struct
+import subprocess
+import threading
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # only needed for sorts exported with --size
+    np = None
+
+import hexagpt
+import ponggpt
+import snakegpt
+import cubegpt
+from bargpt import PALETTE, BarColumns
+from opsgpt import apply_op, coalesce_frames
+from sortsgpt import OpStream, sort_table
+
+# Export settings
+FRAMES = 300  # frames exported when --frames isn't given
+QUEUE_SIZE = 32  # frames waiting for the background writer before rendering waits
+SEED = 1234
+
+COLORS = {
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "blue": (0, 0, 255),
+    "gray": (190, 190, 190),
+}
+
+
+def parse_color(color):
+    # Tk color name or "#rrggbb" -> (r, g, b)
+    if color.startswith("#"):
+        return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return COLORS[color]
+
+
+def flatten(coords):
+    # Tk accepts coordinates as separate arguments or as (nested) sequences
+    flat = []
+    for c in coords:
+        if isinstance(c, (list, tuple)):
+            flat.extend(flatten(c))
+        else:
+            flat.append(c)
+    return flat
+
+
+class FrameCanvas:
+    """
+    Stand-in for tk.Canvas that keeps its items in memory and rasterizes
+    them into an RGB buffer, so the visualizers' own drawing code can
+    render frames without a window. Text items are kept but not drawn.
+    """
+
+    def __init__(self, width, height, bg="black"):
+        self.width = width
+        self.height = height
+        self.bg = parse_color(bg)
+        self.items = {}  # item id -> [kind, coords, options], in stacking order
+        self.next_id = 1
+
+    # ----- tk.Canvas API used by the visualizers -----
+    def _create(self, kind, coords, options):
+        item = self.next_id
+        self.next_id += 1
+        self.items[item] = [kind, flatten(coords), options]
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords, **options):
+        # image is anything with an rgb attribute (a height x width x 3 NumPy
+        # array), drawn with its top-left corner at the coordinates
+        return self._create("image", coords, options)
+
+    def delete(self, item):
+        if item == "all":
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item][1] = flatten(coords)
+        return self.items[item][1]
+
+    def itemconfig(self, item, **options):
+        self.items[item][2].update(options)
+
+    def update_idletasks(self):
+        pass
+
+    # ----- Rasterization -----
+    def render(self):
+        """
+        Paints every item, in stacking order, and returns the frame
+        as width * height * 3 bytes of RGB.
+        """
+        self.pixels = bytearray(bytes(self.bg) * (self.width * self.height))
+        for kind, coords, options in self.items.values():
+            if kind == "line":
+                width = max(1, int(options.get("width", 1)))
+                dash = options.get("dash")
+                color = parse_color(options.get("fill", "black"))
+                for i in range(0, len(coords) - 2, 2):
+                    self.draw_line(coords[i], coords[i + 1], coords[i + 2], coords[i + 3], color, width, dash)
+            elif kind == "rectangle":
+                x0, y0, x1, y1 = coords
+                if options.get("fill"):
+                    self.fill_rect(x0, y0, x1, y1, parse_color(options["fill"]))
+                outline = options.get("outline", "black")
+                if outline:
+                    color = parse_color(outline)
+                    for a, b, c, d in ((x0, y0, x1, y0), (x1, y0, x1, y1), (x1, y1, x0, y1), (x0, y1, x0, y0)):
+                        self.draw_line(a, b, c, d, color)
+            elif kind == "image":
+                self.paste(coords[0], coords[1], options["image"].rgb)
+            elif kind == "oval":
+                if options.get("fill"):
+                    self.fill_oval(*coords, parse_color(options["fill"]))
+            elif kind == "polygon":
+                fill = options.get("fill", "black")
+                if fill:
+                    self.fill_polygon(coords, parse_color(fill))
+                outline = options.get("outline")
+                if outline:
+                    width = max(1, int(options.get("width", 1)))
+                    closed = coords + coords[:2]
+                    for i in range(0, len(coords), 2):
+                        self.draw_line(closed[i], closed[i + 1], closed[i + 2], closed[i + 3],
+                                       parse_color(outline), width)
+        return bytes(self.pixels)
+
+    def fill_span(self, y, x0, x1, color):
+        # Pixels x0 <= x < x1 of row y
+        if 0 <= y < self.height:
+            x0 = max(0, x0)
+            x1 = min(self.width, x1)
+            if x0 < x1:
+                start = (y * self.width + x0) * 3
+                self.pixels[start:start + (x1 - x0) * 3] = bytes(color) * (x1 - x0)
+
+    def paste(self, x, y, rgb):
+        # Copies an RGB image row by row, clipped to the canvas
+        x, y = int(round(x)), int(round(y))
+        height, width = rgb.shape[:2]
+        x0 = max(0, x)
+        x1 = min(self.width, x + width)
+        if x0 >= x1:
+            return
+        for row in range(max(0, y), min(self.height, y + height)):
+            start = (row * self.width + x0) * 3
+            self.pixels[start:start + (x1 - x0) * 3] = rgb[row - y, x0 - x:x1 - x].tobytes()
+
+    def fill_rect(self, x0, y0, x1, y1, color):
+        x0, x1 = sorted((int(round(x0)), int(round(x1))))
+        y0, y1 = sorted((int(round(y0)), int(round(y1))))
+        for y in range(y0, y1):
+            self.fill_span(y, x0, x1, color)
+
+    def fill_oval(self, x0, y0, x1, y1, color):
+        cx = (x0 + x1) / 2
+        cy = (y0 + y1) / 2
+        rx = abs(x1 - x0) / 2
+        ry = abs(y1 - y0) / 2
+        if rx == 0 or ry == 0:
+            return
+        for y in range(int(round(cy - ry)), int(round(cy + ry))):
+            dy = (y + 0.5 - cy) / ry
+            if abs(dy) < 1:
+                half = rx * (1 - dy * dy) ** 0.5
+                self.fill_span(y, int(round(cx - half)), int(round(cx + half)), color)
+
+    def fill_polygon(self, coords, color):
+        # Even-odd scanline fill
+        points = list(zip(coords[0::2], coords[1::2]))
+        ys = [y for _, y in points]
+        for y in range(int(round(min(ys))), int(round(max(ys)))):
+            sy = y + 0.5
+            crossings = []
+            for (xa, ya), (xb, yb) in zip(points, points[1:] + points[:1]):
+                if (ya <= sy) != (yb <= sy):
+                    crossings.append(xa + (sy - ya) * (xb - xa) / (yb - ya))
+            crossings.sort()
+            for i in range(0, len(crossings) - 1, 2):
+                self.fill_span(y, int(round(crossings[i])), int(round(crossings[i + 1])), color)
+
+    def draw_line(self, x0, y0, x1, y1, color, width=1, dash=None):
+        # Bresenham line, stamping a width x width square at each step
+        x0, y0, x1, y1 = (int(round(v)) for v in (x0, y0, x1, y1))
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        offset = width // 2
+        dash_period = sum(dash) if dash else 0
+        step = 0
+        while True:
+            if not dash or step % dash_period < dash[0]:
+                for y in range(y0 - offset, y0 - offset + width):
+                    self.fill_span(y, x0 - offset, x0 - offset + width, color)
+            if x0 == x1 and y0 == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+            step += 1
+
+
+# ----- Frame sinks -----
+def encode_ppm(width, height, rgb):
+    return b"P6\n%d %d\n255\n" % (width, height) + rgb
+
+
+def encode_png(width, height, rgb):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    row = width * 3
+    # Filter type 0 (none) in front of every row
+    raw = b"".join(b"\x00" + rgb[y * row:(y + 1) * row] for y in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 6))
+            + chunk(b"IEND", b""))
+
+
+class FrameSink:
+    """
+    Receives rendered frames. Subclasses write them somewhere;
+    write_frame() is given the frame size and its RGB bytes.
+    """
+
+    def write_frame(self, width, height, rgb):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ImageSequenceSink(FrameSink):
+    # Writes frame_000000.ppm, frame_000001.ppm, ... (or .png) into a directory
+    def __init__(self, directory, image_format="ppm"):
+        self.directory = directory
+        self.image_format = image_format
+        self.encode = encode_png if image_format == "png" else encode_ppm
+        self.count = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write_frame(self, width, height, rgb):
+        path = os.path.join(self.directory, f"frame_{self.count:06d}.{self.image_format}")
+        with open(path, "wb") as f:
+            f.write(self.encode(width, height, rgb))
+        self.count += 1
+
+
+class EncoderSink(FrameSink):
+    # Pipes PPM frames into a local encoder's stdin, e.g.
+    # ffmpeg -y -f image2pipe -vcodec ppm -framerate 50 -i - demo.mp4
+    def __init__(self, command):
+        self.process = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE)
+
+    def write_frame(self, width, height, rgb):
+        self.process.stdin.write(encode_ppm(width, height, rgb))
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+class BackgroundSink(FrameSink):
+    """
+    Hands frames to another sink on a background thread through a bounded
+    queue, so rendering carries on while frames are encoded and written.
+    Rendering only waits when the queue is full.
+    """
+
+    def __init__(self, sink, maxsize=QUEUE_SIZE):
+        self.sink = sink
+        self.queue = queue.Queue(maxsize)
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                return
+            if self.error is None:
+                try:
+                    self.sink.write_frame(*frame)
+                except Exception as e:
+                    self.error = e  # keep draining so write_frame() never blocks forever
+
+    def write_frame(self, width, height, rgb):
+        if self.error is not None:
+            raise self.error
+        self.queue.put((width, height, rgb))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        self.sink.close()
+        if self.error is not None:
+            raise self.error
+
+
+# ----- Headless visualizers -----
+# Each one draws its frames on the given FrameCanvas and yields after every frame.
+def frames_cube(canvas, frames):
+    engine = cubegpt.Engine3D(canvas=canvas)
+    for _ in range(frames):
+        engine.cube.rotate()
+        engine.draw()
+        yield
+
+
+def frames_hexagon(canvas, frames):
+    hexagpt.reset_state()
+    for _ in range(frames):
+        hexagpt.draw(canvas, hexagpt.step())
+        yield
+
+
+def frames_pong(canvas, frames):
+    game = ponggpt.PongGame(canvas=canvas)
+    for _ in range(frames):
+        game.step()
+        game.draw_objects()
+        yield
+
+
+def frames_snake(canvas, frames):
+    # No player, so the snake goes straight and starts over after each crash
+    game = snakegpt.SnakeGame(canvas=canvas)
+    for _ in range(frames):
+        if game.step() is not None:
+            game.reset_state()
+        game.draw()
+        yield
+
+
+class FrameBars(BarColumns):
+    """
+    Draws an array as bars into a FrameCanvas with NumPy (bargpt's per-column
+    min/max fill), for arrays far larger than the canvas is wide. Every frame
+    repaints the whole image, which the canvas copies into its RGB buffer.
+    """
+
+    def __init__(self, canvas, size):
+        super().__init__(size, canvas.width, canvas.height)
+        self.palette = np.array([parse_color(color) for color in PALETTE], dtype=np.uint8)
+        self.rgb = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        canvas.create_image(0, 0, image=self)
+
+    def draw(self, values, highlights=None):
+        self.rgb = self.palette[self.paint(values, 0, self.width, self.highlight_columns(highlights))]
+
+
+def frames_large_sort(canvas, generate, frames, ops_per_frame, size):
+    # The ops are streamed from the sort while it runs and applied to a
+    # NumPy array as per-frame sets of changed elements
+    array = [random.randint(10, canvas.height) for _ in range(size)]
+    values = np.array(array, dtype=np.int32)
+    bars = FrameBars(canvas, size)
+    ops = OpStream(generate, list(array))
+    coalesced = coalesce_frames(array, ops, ops_per_frame)
+    try:
+        pending = next(coalesced, None)
+        for frame in range(frames):
+            writes, highlights = pending or ({}, {})
+            if writes:
+                values[list(writes)] = list(writes.values())
+            pending = next(coalesced, None) if frame < frames - 1 else None
+            # The last frame (end of the sort or of the frame budget) has no highlights
+            bars.draw(values, highlights if pending is not None else {})
+            yield
+            if pending is None:
+                return
+    finally:
+        ops.close()
+
+
+def sort_frames(module, generate):
+    def frames_sort(canvas, frames, ops_per_frame=1, size=None):
+        # draw_array() is made for ARRAY_SIZE bars; any other size is drawn with FrameBars
+        if size is not None and size != module.ARRAY_SIZE:
+            yield from frames_large_sort(canvas, generate, frames, ops_per_frame, size)
+            return
+        array = [random.randint(10, module.CANVAS_HEIGHT) for _ in range(module.ARRAY_SIZE)]
+        animations = generate(list(array))
+        for frame in range(frames):
+            start = frame * ops_per_frame
+            highlights = {}
+            for op in animations[start:start + ops_per_frame]:
+                apply_op(array, op, highlights)
+            # The last frame (end of the sort or of the frame budget) has no highlights
+            last = frame == frames - 1 or start + ops_per_frame >= len(animations)
+            module.draw_array(canvas, array, {} if last else highlights)
+            yield
+            if last:
+                return
+    return frames_sort
+
+
+VISUALIZERS = {
+    "cube": (frames_cube, cubegpt.WIDTH, cubegpt.HEIGHT, "black"),
+    "hexagon": (frames_hexagon, hexagpt.WIDTH, hexagpt.HEIGHT, "white"),
+    "pong": (frames_pong, ponggpt.CANVAS_WIDTH, ponggpt.CANVAS_HEIGHT, "black"),
+    "snake": (frames_snake, snakegpt.BOARD_WIDTH * snakegpt.TILE_SIZE, snakegpt.BOARD_HEIGHT * snakegpt.TILE_SIZE, "black"),
+    **sort_table(sort_frames),
+}
+
+
+def export(name, sink, frames=FRAMES, **options):
+    """
+    Renders a visualizer headless and streams its frames to the sink.
+    Returns the number of frames written.
+    """
+    frames_visualizer, width, height, bg = VISUALIZERS[name]
+    canvas = FrameCanvas(width, height, bg)
+    count = 0
+    for _ in frames_visualizer(canvas, frames, **options):
+        sink.write_frame(width, height, canvas.render())
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a visualizer headless to image files or a video encoder.")
+    parser.add_argument("visualizer", choices=sorted(VISUALIZERS))
+    parser.add_argument("--frames", type=int, default=FRAMES, help="number of frames to render")
+    parser.add_argument("--output", default="frames", help="directory for the image sequence")
+    parser.add_argument("--format", choices=("ppm", "png"), default="ppm", help="image format of the sequence")
+    parser.add_argument("--encoder", help="command that reads PPM frames on stdin instead of writing images, "
+                                          "e.g. \"ffmpeg -y -f image2pipe -vcodec ppm -framerate 50 -i - demo.mp4\"")
+    parser.add_argument("--ops-per-frame", type=int, default=1, help="sort operations shown per frame")
+    parser.add_argument("--size", type=int, help="number of elements to sort (other sizes than the default need NumPy)")
+    args = parser.parse_args()
+
+    random.seed(SEED)
+    options = {"ops_per_frame": args.ops_per_frame, "size": args.size} if args.visualizer.endswith("_sort") else {}
+    sink = EncoderSink(args.encoder) if args.encoder else ImageSequenceSink(args.output, args.format)
+    sink = BackgroundSink(sink)
+    try:
+        count = export(args.visualizer, sink, args.frames, **options)
+    finally:
+        sink.close()
+    print(f"Wrote {count} frames")
+
+
+if __name__ == "__main__":
+    main()
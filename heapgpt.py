@@ -53,13 +53,14 @@ def heapify(arr, heap_size, i, animations):
         heapify(arr, heap_size, largest, animations)
 
 
-def heap_sort(arr):
+def heap_sort(arr, animations=None):
     """
     Performs Heap Sort on a copy of the array.
     It first builds a max heap, then repeatedly extracts the maximum element,
-    recording all key animation operations.
+    recording all key animation operations (into animations, if given).
     """
-    animations = []
+    if animations is None:
+        animations = []
     n = len(arr)
 
     # Build max heap
@@ -5,6 +5,7 @@ import math
 WIDTH = 600
 HEIGHT = 600
 HEX_RADIUS = 250       # distance from center to each vertex
+HEX_SIDES = 6          # number of sides of the spinning polygon
 BALL_RADIUS = 10
 
 GRAVITY = 0.5          # acceleration (pixels per frame^2)
@@ -13,13 +14,19 @@ RESTITUTION = 0.9     # energy retained after bounce (0 to 1)
 DT = 1                 # time step (implicit per frame)
 
 # ----- Initial Ball State -----
-ball_x = WIDTH / 2
-ball_y = HEIGHT / 2 - 100
-ball_vx = 3.0
-ball_vy = 0.0
+def reset_state():
+    # Puts the ball and the hexagon back in their starting state
+    global ball_x, ball_y, ball_vx, ball_vy, hex_angle, bounce_count
+    ball_x = WIDTH / 2
+    ball_y = HEIGHT / 2 - 100
+    ball_vx = 3.0
+    ball_vy = 0.0
+    hex_angle = 0          # current rotation angle (radians)
+    bounce_count = 0       # bounces off the walls so far
+
+reset_state()
 
 # ----- Hexagon Rotation -----
-hex_angle = 0          # current rotation angle (radians)
 hex_angular_velocity = 0.02  # radians per frame
 
 # ----- Canvas Center -----
@@ -41,29 +48,48 @@ def reflect(vx, vy, nx, ny):
     d = dot(vx, vy, nx, ny)
     return vx - 2 * d * nx, vy - 2 * d * ny
 
-def get_hexagon_vertices(angle):
-    # Returns the current vertex list (six (x,y) pairs) for a regular hexagon
-    vertices = []
-    for i in range(6):
-        theta = angle + math.radians(60 * i)
-        x = center_x + HEX_RADIUS * math.cos(theta)
-        y = center_y + HEX_RADIUS * math.sin(theta)
-        vertices.append((x, y))
-    return vertices
+def regular_polygon(sides, radius):
+    # Returns the vertices of a regular polygon centered on the origin
+    return [(radius * math.cos(2 * math.pi * i / sides), radius * math.sin(2 * math.pi * i / sides))
+            for i in range(sides)]
+
+def set_container(points):
+    # Uses the convex polygon with the given vertices (relative to the center)
+    # as the container. The edge vectors only rotate with the polygon and their
+    # lengths don't change, so both are computed here once instead of every frame.
+    global container_points, container_edges, container_inv_len2
+    container_points = list(points)
+    container_edges = []
+    container_inv_len2 = []
+    for i in range(len(container_points)):
+        x1, y1 = container_points[i]
+        x2, y2 = container_points[(i + 1) % len(container_points)]
+        container_edges.append((x2 - x1, y2 - y1))
+        len2 = (x2 - x1) ** 2 + (y2 - y1) ** 2
+        container_inv_len2.append(1 / len2 if len2 > 0 else 0)
 
-def closest_point_on_segment(px, py, x1, y1, x2, y2):
-    # Finds the point on segment (x1,y1)-(x2,y2) closest to point (px,py)
-    dx = x2 - x1
-    dy = y2 - y1
-    if dx == 0 and dy == 0:
-        return x1, y1
-    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+def get_hexagon_vertices(angle):
+    # Returns the current vertices and edge vectors: the container and its
+    # edges rotated by angle about the center, with one cos/sin for both
+    c = math.cos(angle)
+    s = math.sin(angle)
+    vertices = [(center_x + x * c - y * s, center_y + x * s + y * c) for x, y in container_points]
+    edges = [(dx * c - dy * s, dx * s + dy * c) for dx, dy in container_edges]
+    return vertices, edges
+
+def closest_point_on_segment(px, py, x1, y1, dx, dy, inv_len2):
+    # Finds the point on the segment from (x1,y1) along (dx,dy) closest to
+    # point (px,py), given the precomputed 1 / (segment length)^2 (0 for a point)
+    t = ((px - x1) * dx + (py - y1) * dy) * inv_len2
     t = max(0, min(1, t))
     return x1 + t * dx, y1 + t * dy
 
-# ----- Main Update Loop -----
-def update():
-    global ball_x, ball_y, ball_vx, ball_vy, hex_angle
+set_container(regular_polygon(HEX_SIDES, HEX_RADIUS))
+
+# ----- Physics Step -----
+def step():
+    # Advances the simulation by one frame and returns the hexagon vertices
+    global ball_x, ball_y, ball_vx, ball_vy, hex_angle, bounce_count
 
     # Update the hexagon's rotation
     hex_angle += hex_angular_velocity
@@ -75,15 +101,13 @@ def update():
     ball_x += ball_vx
     ball_y += ball_vy
 
-    # Get the current hexagon vertices
-    vertices = get_hexagon_vertices(hex_angle)
+    # Get the current hexagon vertices and edges
+    vertices, edges = get_hexagon_vertices(hex_angle)
 
     # Check for collisions with each hexagon edge
-    for i in range(len(vertices)):
-        p1 = vertices[i]
-        p2 = vertices[(i + 1) % len(vertices)]
+    for (x1, y1), (edge_dx, edge_dy), inv_len2 in zip(vertices, edges, container_inv_len2):
         # Find the closest point on this edge to the ball's center
-        cx, cy = closest_point_on_segment(ball_x, ball_y, p1[0], p1[1], p2[0], p2[1])
+        cx, cy = closest_point_on_segment(ball_x, ball_y, x1, y1, edge_dx, edge_dy, inv_len2)
         # Compute distance from ball center to that closest point
         dist = math.hypot(ball_x - cx, ball_y - cy)
         if dist < BALL_RADIUS:
@@ -91,8 +115,6 @@ def update():
             nx, ny = ball_x - cx, ball_y - cy
             if nx == 0 and ny == 0:
                 # In a degenerate case (center exactly on the line), use the edge's perpendicular.
-                edge_dx = p2[0] - p1[0]
-                edge_dy = p2[1] - p1[1]
                 nx, ny = -edge_dy, edge_dx
                 # Flip to point toward the hexagon’s center if needed.
                 if dot(nx, ny, center_x - cx, center_y - cy) < 0:
@@ -120,6 +142,7 @@ def update():
                 # Update ball velocity by adding back the wall’s velocity.
                 ball_vx = new_rel_vx + wall_vx
                 ball_vy = new_rel_vy + wall_vy
+                bounce_count += 1
 
                 # Push the ball out so it’s not overlapping the wall.
                 overlap = BALL_RADIUS - dist
@@ -130,6 +153,17 @@ def update():
     ball_vx *= FRICTION
     ball_vy *= FRICTION
 
+    return vertices
+
+# ----- Main Update Loop -----
+def update():
+    vertices = step()
+    draw(canvas, vertices)
+
+    # Schedule the next frame (20ms ~ 50fps)
+    root.after(20, update)
+
+def draw(canvas, vertices):
     # Redraw the scene.
     canvas.delete("all")
     # Draw the hexagon.
@@ -144,14 +178,12 @@ def update():
         fill="red"
     )
 
-    # Schedule the next frame (20ms ~ 50fps)
-    root.after(20, update)
-
 # ----- TKinter Setup -----
-root = tk.Tk()
-root.title("Bouncing Ball in a Spinning Hexagon")
-canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="white")
-canvas.pack()
-
-update()
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Bouncing Ball in a Spinning Hexagon")
+    canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg="white")
+    canvas.pack()
+
+    update()
+    root.mainloop()
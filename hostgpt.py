@@ -0,0 +1,203 @@
+import argparse
+import asyncio
+import random
+import tkinter as tk
+from tkinter import ttk
+
+import hexagpt
+import ponggpt
+import snakegpt
+import cubegpt
+from opsgpt import apply_op
+from sortsgpt import sort_table
+
+# Host settings
+FRAME_INTERVAL = 0.02  # seconds per frame (~50 FPS), shared by every view
+COLUMNS = 3  # views per row in the grid layout
+DEFAULT_VIEWS = ["cube", "hexagon", "quick_sort", "heap_sort", "merge_sort"]
+SNAKE_FRAMES = max(1, round(snakegpt.GAME_SPEED / 1000 / FRAME_INTERVAL))  # frames per snake move
+
+
+class FrameScheduler:
+    """
+    Paces every view from one clock. Views await next_frame(), do one
+    frame of work without awaiting anything else, and the scheduler then
+    lets Tk repaint all the views at once.
+    """
+
+    def __init__(self, root, interval=FRAME_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self.running = True
+        self.tick = None
+
+    async def next_frame(self):
+        await self.tick
+
+    def stop(self):
+        self.running = False
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self.tick = loop.create_future()
+        deadline = loop.time()
+        while self.running:
+            # Wake every view waiting for this frame and let them draw
+            tick, self.tick = self.tick, loop.create_future()
+            tick.set_result(None)
+            await asyncio.sleep(0)
+            try:
+                self.root.update()
+            except tk.TclError:  # window closed
+                return
+            deadline += self.interval
+            delay = deadline - loop.time()
+            if delay < 0:
+                # Running behind: skip the missed frames instead of bursting
+                deadline = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+
+def visible(canvas):
+    # Hidden views (e.g. other tabs) keep stepping but skip drawing
+    return canvas.winfo_viewable()
+
+
+def focus_on_click(canvas):
+    canvas.bind("<Button-1>", lambda event: canvas.focus_set())
+
+
+# ----- Views -----
+# Each view is a coroutine that runs one engine on its own canvas.
+async def cube_view(canvas, scheduler):
+    engine = cubegpt.Engine3D(canvas=canvas)
+    while True:
+        await scheduler.next_frame()
+        engine.cube.rotate()
+        if visible(canvas):
+            engine.draw()
+
+
+async def hexagon_view(canvas, scheduler):
+    hexagpt.reset_state()
+    while True:
+        await scheduler.next_frame()
+        vertices = hexagpt.step()
+        if visible(canvas):
+            hexagpt.draw(canvas, vertices)
+
+
+async def pong_view(canvas, scheduler):
+    # Click the view, then play with the arrow keys
+    game = ponggpt.PongGame(canvas=canvas)
+    focus_on_click(canvas)
+    for key in ("Up", "Down"):
+        canvas.bind(f"<KeyPress-{key}>", game.key_down)
+        canvas.bind(f"<KeyRelease-{key}>", game.key_up)
+    while True:
+        await scheduler.next_frame()
+        game.step()
+        if visible(canvas):
+            game.draw_objects()
+
+
+async def snake_view(canvas, scheduler):
+    # Click the view, then steer with the arrow keys; starts over after a crash
+    game = snakegpt.SnakeGame(canvas=canvas)
+    focus_on_click(canvas)
+    for key in ("Up", "Down", "Left", "Right"):
+        canvas.bind(f"<{key}>", game.on_key)
+    frame = 0
+    while True:
+        await scheduler.next_frame()
+        frame += 1
+        if frame % SNAKE_FRAMES == 0:
+            if game.step() is not None:
+                game.reset_state()
+            if visible(canvas):
+                game.draw()
+
+
+def sort_view(module, generate):
+    async def view(canvas, scheduler, ops_per_frame=1):
+        # Sorts a fresh random array, over and over
+        while True:
+            array = [random.randint(10, module.CANVAS_HEIGHT) for _ in range(module.ARRAY_SIZE)]
+            animations = generate(list(array))
+            for start in range(0, len(animations), ops_per_frame):
+                await scheduler.next_frame()
+                highlights = {}
+                for op in animations[start:start + ops_per_frame]:
+                    apply_op(array, op, highlights)
+                if visible(canvas):
+                    module.draw_array(canvas, array, highlights)
+            await scheduler.next_frame()
+            module.draw_array(canvas, array)
+    return view
+
+
+VIEWS = {
+    "cube": (cube_view, cubegpt.WIDTH, cubegpt.HEIGHT, "black"),
+    "hexagon": (hexagon_view, hexagpt.WIDTH, hexagpt.HEIGHT, "white"),
+    "pong": (pong_view, ponggpt.CANVAS_WIDTH, ponggpt.CANVAS_HEIGHT, "black"),
+    "snake": (snake_view, snakegpt.BOARD_WIDTH * snakegpt.TILE_SIZE, snakegpt.BOARD_HEIGHT * snakegpt.TILE_SIZE, "black"),
+    **sort_table(sort_view),
+}
+
+
+async def host(names, tabs=False, columns=COLUMNS, ops_per_frame=1):
+    """
+    Runs the named views in one Tk window, either in a grid or in tabs,
+    as tasks on the running event loop until the window is closed.
+    """
+    root = tk.Tk()
+    root.title("Simulations")
+    scheduler = FrameScheduler(root)
+    root.protocol("WM_DELETE_WINDOW", scheduler.stop)
+    notebook = ttk.Notebook(root) if tabs else None
+    if notebook is not None:
+        notebook.pack(fill="both", expand=True)
+
+    tasks = []
+    for index, name in enumerate(names):
+        view, width, height, bg = VIEWS[name]
+        if notebook is not None:
+            canvas = tk.Canvas(notebook, width=width, height=height, bg=bg)
+            notebook.add(canvas, text=name)
+        else:
+            canvas = tk.Canvas(root, width=width, height=height, bg=bg)
+            canvas.grid(row=index // columns, column=index % columns)
+        options = {"ops_per_frame": ops_per_frame} if name.endswith("_sort") else {}
+        tasks.append(asyncio.ensure_future(view(canvas, scheduler, **options)))
+
+    try:
+        await scheduler.run()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            root.destroy()
+        except tk.TclError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run several visualizers in one window and one process.")
+    parser.add_argument("views", nargs="*", metavar="VIEW",
+                        help=f"views to show, from: {', '.join(VIEWS)} (default: {' '.join(DEFAULT_VIEWS)})")
+    parser.add_argument("--tabs", action="store_true", help="one tab per view instead of a grid")
+    parser.add_argument("--columns", type=int, default=COLUMNS, help="views per row in the grid")
+    parser.add_argument("--ops-per-frame", type=int, default=1, help="sort operations shown per frame")
+    args = parser.parse_args()
+    unknown = [name for name in args.views if name not in VIEWS]
+    if unknown:
+        parser.error(f"unknown views: {', '.join(unknown)}")
+    # Each view runs once (the hexagon simulation lives in module globals)
+    names = list(dict.fromkeys(args.views or DEFAULT_VIEWS))
+    asyncio.run(host(names, args.tabs, args.columns, args.ops_per_frame))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,16 @@ def draw_array(canvas, array, highlights={}):
         canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="")
     canvas.update_idletasks()
 
+def merge_sort_animations(arr, animations=None):
+    """
+    Performs Merge Sort on a copy of the array and
+    returns the list of recorded operations (or the given animations).
+    """
+    if animations is None:
+        animations = []
+    merge_sort(arr, 0, len(arr) - 1, animations)
+    return animations
+
 def merge_sort(arr, left, right, animations):
     """
     Recursively sorts the array (from index left to right) using Merge Sort,
@@ -96,8 +106,7 @@ def start_sort(canvas):
     draw_array(canvas, current_array)
     # Create a copy for sorting so that current_array remains unsorted for animation
     arr_copy = current_array.copy()
-    animations = []
-    merge_sort(arr_copy, 0, len(arr_copy) - 1, animations)
+    animations = merge_sort_animations(arr_copy)
     animate(animations, canvas)
 
 def reset(canvas):
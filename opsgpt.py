@@ -0,0 +1,143 @@
+import argparse
+import random
+
+from sortsgpt import SORTS
+
+# Settings for the report
+ARRAY_SIZE = 2000
+MAX_VALUE = 400
+OPS_PER_FRAME = 50
+SAMPLE_EVERY = 10  # "sample" keeps one compare out of this many
+
+COMPARE_MODES = ("keep", "drop", "sample", "coalesce")
+
+# Elements a naive animator redraws for each operation
+TOUCHED = {"compare": 2, "swap": 2, "pivot": 1, "overwrite": 1}
+
+
+def apply_op(array, op, highlights):
+    # Applies one recorded sort operation and its highlight, like the visualizers' animate()
+    if op[0] == "compare":
+        highlights.update({op[1]: "red", op[2]: "red"})
+    elif op[0] == "swap":
+        i, j = op[1], op[2]
+        array[i], array[j] = array[j], array[i]
+        highlights.update({i: "green", j: "green"})
+    elif op[0] == "pivot":
+        highlights[op[1]] = "blue"
+    elif op[0] == "overwrite":
+        array[op[1]] = op[2]
+        highlights[op[1]] = "green"
+
+
+class OpStats:
+    """
+    Counts what the pipeline did: operations in and out, frames, the element
+    redraws one-op-at-a-time playback would need (touched) and the ones the
+    coalesced frames need (dirty).
+    """
+
+    def __init__(self):
+        self.ops_in = 0
+        self.ops_out = 0
+        self.frames = 0
+        self.touched = 0
+        self.dirty = 0
+
+    @property
+    def ratio(self):
+        # How many times less redraw work the coalesced frames need
+        return self.touched / self.dirty if self.dirty else float("inf")
+
+    def __str__(self):
+        return (f"{self.ops_in} ops in, {self.ops_out} ops out, {self.frames} frames, "
+                f"{self.touched} -> {self.dirty} element redraws ({self.ratio:.1f}x less)")
+
+
+def filter_compares(animations, mode="keep", every=SAMPLE_EVERY, stats=None):
+    """
+    Passes the recorded operations through, thinning out the "compare" ops
+    which only change a highlight: "keep" them all, "drop" them all, "sample"
+    one in every, or "coalesce" each run of compares into its last one.
+    """
+    sampled = 0
+    pending = None
+    for op in animations:
+        if stats is not None:
+            stats.ops_in += 1
+            stats.touched += TOUCHED.get(op[0], 0)
+        if op[0] == "compare" and mode != "keep":
+            if mode == "sample":
+                if sampled % every == 0:
+                    yield op
+                sampled += 1
+            elif mode == "coalesce":
+                pending = op
+            continue
+        if pending is not None:
+            yield pending
+            pending = None
+        yield op
+    if pending is not None:
+        yield pending
+
+
+def coalesce_frames(array, animations, ops_per_frame=OPS_PER_FRAME, compares="keep", every=SAMPLE_EVERY, stats=None):
+    """
+    Groups the operations into frames of ops_per_frame (after filtering the
+    compares) and yields one (writes, highlights) pair per frame. writes maps
+    each index whose value changed during the frame to its new value, so runs
+    of swaps become one set of dirty indices and swaps that undo each other
+    disappear. highlights is what the visualizers would highlight for the frame.
+    The given array is not modified.
+    """
+    array = list(array)
+    frame_ops = 0
+    before = {}
+    highlights = {}
+    for op in filter_compares(animations, compares, every, stats):
+        # Remember the old value of everything the frame writes to
+        if op[0] == "swap":
+            before.setdefault(op[1], array[op[1]])
+            before.setdefault(op[2], array[op[2]])
+        elif op[0] == "overwrite":
+            before.setdefault(op[1], array[op[1]])
+        apply_op(array, op, highlights)
+        frame_ops += 1
+        if frame_ops == ops_per_frame:
+            yield end_frame(array, before, highlights, frame_ops, stats)
+            frame_ops = 0
+            before = {}
+            highlights = {}
+    if frame_ops:
+        yield end_frame(array, before, highlights, frame_ops, stats)
+
+
+def end_frame(array, before, highlights, frame_ops, stats):
+    writes = {i: array[i] for i, old in before.items() if array[i] != old}
+    if stats is not None:
+        stats.ops_out += frame_ops
+        stats.frames += 1
+        stats.dirty += len(writes.keys() | highlights.keys())
+    return writes, highlights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report how much the op-stream coalescing saves for each sort.")
+    parser.add_argument("--size", type=int, default=ARRAY_SIZE, help="number of elements")
+    parser.add_argument("--ops-per-frame", type=int, default=OPS_PER_FRAME, help="operations per frame")
+    parser.add_argument("--every", type=int, default=SAMPLE_EVERY, help="keep one compare in this many when sampling")
+    args = parser.parse_args()
+
+    array = [random.randint(10, MAX_VALUE) for _ in range(args.size)]
+    for name, sort in SORTS.items():
+        animations = sort.generate(list(array))
+        for mode in COMPARE_MODES:
+            stats = OpStats()
+            for _ in coalesce_frames(array, animations, args.ops_per_frame, mode, args.every, stats):
+                pass
+            print(f"{name:<19} {mode:<9} {stats}")
+
+
+if __name__ == "__main__":
+    main()
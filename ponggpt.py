@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
+import math
+import random
 
 # Game settings
 CANVAS_WIDTH = 800
@@ -8,17 +10,58 @@ PADDLE_WIDTH = 10
 PADDLE_HEIGHT = 80
 BALL_SIZE = 10
 
-PLAYER_SPEED = 20  # pixels per key press for player paddle
+PLAYER_SPEED = 6  # player paddle movement speed per update while an arrow key is held
 AI_SPEED = 3  # AI paddle movement speed per update
+AI_REACTION_DELAY = 0  # updates the AI waits before reacting to a new ball trajectory
+AI_ERROR = 0  # the AI aims up to this many pixels away from the predicted intercept
 BALL_SPEED_X = 4  # initial ball speed (x-direction)
 BALL_SPEED_Y = 4  # initial ball speed (y-direction)
+BALL_SPEEDUP = 1.0  # ball speed multiplier on every paddle hit (1.0 = constant speed)
+MAX_BALL_SPEED = 30  # cap on the ball speed (pixels per update) when speeding up
+MAX_BOUNCE_ANGLE = 0  # degrees; if > 0 the return angle depends on where the ball hits the paddle
+MAX_BOUNCES_PER_FRAME = 4  # wall and paddle bounces resolved within a single update
 
 GAME_DURATION = 120  # game duration in seconds
 
 
+def swept_hit(x, y, dx, dy, left, top, right, bottom):
+    """
+    Returns the time of impact in [0, 1] of the point (x, y) moving by (dx, dy)
+    with the box left..right x top..bottom, or None if it doesn't enter the box.
+    """
+    t_enter = -math.inf
+    t_exit = math.inf
+    for start, delta, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+        if delta == 0:
+            if not low <= start <= high:
+                return None
+            continue
+        t1 = (low - start) / delta
+        t2 = (high - start) / delta
+        t_enter = max(t_enter, min(t1, t2))
+        t_exit = min(t_exit, max(t1, t2))
+    # A point that starts inside the box is already past the paddle face
+    if t_enter > t_exit or t_enter < 0 or t_enter > 1:
+        return None
+    return t_enter
+
+
 class PongGame:
-    def __init__(self, root):
+    def __init__(self, root=None, canvas=None):
         self.root = root
+        # Arrow keys held down, and keys pressed since the last update
+        # (so a tap shorter than one update still moves the paddle)
+        self.keys_held = set()
+        self.keys_tapped = set()
+        if root is None:
+            # Headless game: no widgets or timers, advance it with step()
+            # (and draw it on the given canvas, if any, with draw_objects())
+            self.canvas = canvas
+            if canvas is not None:
+                self.create_objects()
+            self.reset_game_state()
+            self.game_over = False
+            return
         root.title("Pong Game")
 
         # Timer label (above the canvas)
@@ -28,13 +71,15 @@ class PongGame:
         # Canvas for the game
         self.canvas = tk.Canvas(root, width=CANVAS_WIDTH, height=CANVAS_HEIGHT, bg="black")
         self.canvas.pack()
+        self.create_objects()
 
         # Initialize game state
         self.reset_game_state()
 
-        # Bind arrow keys for moving player's paddle
-        root.bind("<Up>", self.move_up)
-        root.bind("<Down>", self.move_down)
+        # Track the arrow keys' state for moving player's paddle
+        for key in ("Up", "Down"):
+            root.bind(f"<KeyPress-{key}>", self.key_down)
+            root.bind(f"<KeyRelease-{key}>", self.key_up)
 
         # Start the game loops
         self.game_over = False
@@ -48,6 +93,8 @@ class PongGame:
 
         self.ai_x = CANVAS_WIDTH - 20 - PADDLE_WIDTH
         self.ai_y = CANVAS_HEIGHT / 2 - PADDLE_HEIGHT / 2
+        self.ai_target = None  # where the AI paddle is heading (None = predict again)
+        self.ai_wait = 0
 
         # Ball position and velocity
         self.ball_x = CANVAS_WIDTH / 2 - BALL_SIZE / 2
@@ -62,43 +109,37 @@ class PongGame:
         # Remaining time
         self.time_left = GAME_DURATION
 
-    def move_up(self, event):
-        # Move player paddle up (don't let it go out of bounds)
-        self.player_y = max(0, self.player_y - PLAYER_SPEED)
+    def key_down(self, event):
+        # Only record the key; the paddle moves in step() (key repeats are harmless)
+        self.keys_held.add(event.keysym)
+        self.keys_tapped.add(event.keysym)
 
-    def move_down(self, event):
-        # Move player paddle down (don't let it go out of bounds)
-        self.player_y = min(CANVAS_HEIGHT - PADDLE_HEIGHT, self.player_y + PLAYER_SPEED)
+    def key_up(self, event):
+        self.keys_held.discard(event.keysym)
+
+    def move_player(self):
+        # Move player paddle while a key is held (don't let it go out of bounds)
+        keys = self.keys_held | self.keys_tapped
+        self.keys_tapped.clear()
+        direction = ("Down" in keys) - ("Up" in keys)
+        self.player_y = max(0, min(CANVAS_HEIGHT - PADDLE_HEIGHT, self.player_y + direction * PLAYER_SPEED))
 
     def update_game(self):
         if self.game_over:
             return
 
-        # Update ball position
-        self.ball_x += self.ball_dx
-        self.ball_y += self.ball_dy
-
-        # Bounce off top and bottom walls
-        if self.ball_y <= 0:
-            self.ball_y = 0
-            self.ball_dy = -self.ball_dy
-        elif self.ball_y + BALL_SIZE >= CANVAS_HEIGHT:
-            self.ball_y = CANVAS_HEIGHT - BALL_SIZE
-            self.ball_dy = -self.ball_dy
-
-        # Check collision with player paddle
-        if (self.ball_x <= self.player_x + PADDLE_WIDTH and
-                self.ball_y + BALL_SIZE >= self.player_y and
-                self.ball_y <= self.player_y + PADDLE_HEIGHT):
-            self.ball_x = self.player_x + PADDLE_WIDTH
-            self.ball_dx = -self.ball_dx
-
-        # Check collision with AI paddle
-        if (self.ball_x + BALL_SIZE >= self.ai_x and
-                self.ball_y + BALL_SIZE >= self.ai_y and
-                self.ball_y <= self.ai_y + PADDLE_HEIGHT):
-            self.ball_x = self.ai_x - BALL_SIZE
-            self.ball_dx = -self.ball_dx
+        self.step()
+
+        self.draw_objects()
+        # Call update_game again after 20ms (~50 FPS)
+        self.root.after(20, self.update_game)
+
+    def step(self):
+        # Advance the ball, paddles and scores by one frame (no drawing)
+        self.move_player()
+
+        # Update ball position, bouncing off the walls and paddles it hits on the way
+        self.move_ball()
 
         # Check if ball goes off the left side (AI scores)
         if self.ball_x < 0:
@@ -109,17 +150,101 @@ class PongGame:
             self.player_score += 1
             self.reset_ball(direction=-1)
 
-        # Simple AI: move the AI paddle toward the ball's center
-        ai_center = self.ai_y + PADDLE_HEIGHT / 2
-        ball_center = self.ball_y + BALL_SIZE / 2
-        if ai_center < ball_center:
-            self.ai_y = min(CANVAS_HEIGHT - PADDLE_HEIGHT, self.ai_y + AI_SPEED)
-        elif ai_center > ball_center:
-            self.ai_y = max(0, self.ai_y - AI_SPEED)
+        self.move_ai()
 
-        self.draw_objects()
-        # Call update_game again after 20ms (~50 FPS)
-        self.root.after(20, self.update_game)
+    def move_ai(self):
+        # The target is only predicted again after the ball's trajectory
+        # changes (paddle hit or serve), every other update just moves toward it.
+        if self.ai_target is None:
+            self.ai_target = self.predict_ai_target()
+            self.ai_wait = AI_REACTION_DELAY
+        if self.ai_wait > 0:
+            self.ai_wait -= 1
+            return
+        step = max(-AI_SPEED, min(AI_SPEED, self.ai_target - self.ai_y))
+        self.ai_y = max(0, min(CANVAS_HEIGHT - PADDLE_HEIGHT, self.ai_y + step))
+
+    def predict_ai_target(self):
+        # Returns the paddle y that centers the AI paddle on the point where the
+        # ball will reach it, or the middle of the court if the ball moves away.
+        if self.ball_dx <= 0:
+            return CANVAS_HEIGHT / 2 - PADDLE_HEIGHT / 2
+        # Follow the straight path to the paddle, then fold it back into the
+        # court: every wall bounce mirrors the path, which makes a triangle wave.
+        frames = (self.ai_x - BALL_SIZE - self.ball_x) / self.ball_dx
+        span = CANVAS_HEIGHT - BALL_SIZE
+        y = (self.ball_y + self.ball_dy * frames) % (2 * span)
+        if y > span:
+            y = 2 * span - y
+        if AI_ERROR > 0:
+            y += random.uniform(-AI_ERROR, AI_ERROR)
+        return y + BALL_SIZE / 2 - PADDLE_HEIGHT / 2
+
+    def move_ball(self):
+        # Sweep the ball's path for this frame against the walls and the paddle
+        # it is moving toward, bouncing off whichever it reaches first and
+        # sweeping the rest of the path from there, so fast balls can't skip
+        # past a paddle between two frames, even right after a wall bounce.
+        remaining = 1.0  # part of this frame's movement still to do
+        for _ in range(MAX_BOUNCES_PER_FRAME):
+            if self.ball_dx < 0:
+                paddle_x, paddle_y, direction = self.player_x, self.player_y, 1
+            else:
+                paddle_x, paddle_y, direction = self.ai_x, self.ai_y, -1
+            dx = self.ball_dx * remaining
+            dy = self.ball_dy * remaining
+
+            # Sweeping the ball's corner against the paddle grown by the ball size
+            # is the same as sweeping the whole ball against the paddle.
+            t_paddle = swept_hit(self.ball_x, self.ball_y, dx, dy,
+                                 paddle_x - BALL_SIZE, paddle_y - BALL_SIZE,
+                                 paddle_x + PADDLE_WIDTH, paddle_y + PADDLE_HEIGHT)
+            t_wall = self.wall_hit(dy)
+            if t_paddle is None and t_wall is None:
+                break
+
+            # Move to the first point of impact and bounce there
+            t = t_paddle if t_wall is None or (t_paddle is not None and t_paddle <= t_wall) else t_wall
+            self.ball_x += dx * t
+            self.ball_y += dy * t
+            if t == t_paddle:
+                self.bounce_off_paddle(paddle_y, direction)
+            else:
+                self.ball_y = 0 if dy < 0 else CANVAS_HEIGHT - BALL_SIZE
+                self.ball_dy = -self.ball_dy
+            remaining *= 1 - t
+
+        # Use up the rest of the frame
+        self.ball_x += self.ball_dx * remaining
+        self.ball_y += self.ball_dy * remaining
+
+    def wall_hit(self, dy):
+        # Time of impact in [0, 1] of the ball moving by dy with the top or
+        # bottom wall, or None if it doesn't reach a wall
+        if dy < 0:
+            t = -self.ball_y / dy
+        elif dy > 0:
+            t = (CANVAS_HEIGHT - BALL_SIZE - self.ball_y) / dy
+        else:
+            return None
+        return max(0.0, t) if t <= 1 else None
+
+    def bounce_off_paddle(self, paddle_y, direction):
+        # Send the ball back (direction 1 means toward the right), speeding it
+        # up and aiming it by the hit position when those options are enabled.
+        self.ai_target = None
+        speed = math.hypot(self.ball_dx, self.ball_dy)
+        speed = min(speed * BALL_SPEEDUP, max(speed, MAX_BALL_SPEED))
+        if MAX_BOUNCE_ANGLE > 0:
+            # -1 at the paddle's top edge, 1 at its bottom edge
+            offset = ((self.ball_y + BALL_SIZE / 2) - (paddle_y + PADDLE_HEIGHT / 2)) / ((PADDLE_HEIGHT + BALL_SIZE) / 2)
+            angle = math.radians(MAX_BOUNCE_ANGLE) * max(-1, min(1, offset))
+            self.ball_dx = direction * speed * math.cos(angle)
+            self.ball_dy = speed * math.sin(angle)
+        else:
+            scale = speed / math.hypot(self.ball_dx, self.ball_dy)
+            self.ball_dx = direction * abs(self.ball_dx) * scale
+            self.ball_dy = self.ball_dy * scale
 
     def reset_ball(self, direction):
         # Reset ball to the center and set its direction (-1 means toward left, 1 toward right)
@@ -127,6 +252,7 @@ class PongGame:
         self.ball_y = CANVAS_HEIGHT / 2 - BALL_SIZE / 2
         self.ball_dx = BALL_SPEED_X * direction
         self.ball_dy = BALL_SPEED_Y
+        self.ai_target = None
 
     def update_timer(self):
         if self.time_left <= 0:
@@ -147,37 +273,47 @@ class PongGame:
         # Call update_timer every 1000ms (1 second)
         self.root.after(1000, self.update_timer)
 
-    def draw_objects(self):
-        # Clear the canvas
-        self.canvas.delete("all")
-
-        # Draw center dashed line
+    def create_objects(self):
+        # Create the canvas items once; draw_objects() only moves them
+        # Center dashed line
         self.canvas.create_line(CANVAS_WIDTH / 2, 0, CANVAS_WIDTH / 2, CANVAS_HEIGHT, fill="white", dash=(5, 5))
 
-        # Draw player paddle
-        self.canvas.create_rectangle(
+        # Paddles and ball (placed by the first draw_objects())
+        self.player_item = self.canvas.create_rectangle(0, 0, 0, 0, fill="white")
+        self.ai_item = self.canvas.create_rectangle(0, 0, 0, 0, fill="white")
+        self.ball_item = self.canvas.create_oval(0, 0, 0, 0, fill="white")
+
+        # Score counter (inside the canvas at top center)
+        self.score_item = self.canvas.create_text(CANVAS_WIDTH / 2, 30, text="", fill="white", font=("Helvetica", 24))
+        self.score_text = None
+
+    def draw_objects(self):
+        # Move player paddle
+        self.canvas.coords(
+            self.player_item,
             self.player_x, self.player_y,
-            self.player_x + PADDLE_WIDTH, self.player_y + PADDLE_HEIGHT,
-            fill="white"
+            self.player_x + PADDLE_WIDTH, self.player_y + PADDLE_HEIGHT
         )
 
-        # Draw AI paddle
-        self.canvas.create_rectangle(
+        # Move AI paddle
+        self.canvas.coords(
+            self.ai_item,
             self.ai_x, self.ai_y,
-            self.ai_x + PADDLE_WIDTH, self.ai_y + PADDLE_HEIGHT,
-            fill="white"
+            self.ai_x + PADDLE_WIDTH, self.ai_y + PADDLE_HEIGHT
         )
 
-        # Draw ball
-        self.canvas.create_oval(
+        # Move ball
+        self.canvas.coords(
+            self.ball_item,
             self.ball_x, self.ball_y,
-            self.ball_x + BALL_SIZE, self.ball_y + BALL_SIZE,
-            fill="white"
+            self.ball_x + BALL_SIZE, self.ball_y + BALL_SIZE
         )
 
-        # Draw the score counter (inside the canvas at top center)
+        # Update the score counter only when a score changed
         score_text = f"{self.player_score} : {self.ai_score}"
-        self.canvas.create_text(CANVAS_WIDTH / 2, 30, text=score_text, fill="white", font=("Helvetica", 24))
+        if score_text != self.score_text:
+            self.canvas.itemconfig(self.score_item, text=score_text)
+            self.score_text = score_text
 
 
 if __name__ == "__main__":
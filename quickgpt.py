@@ -28,23 +28,31 @@ def draw_array(canvas, array, highlights={}):
     canvas.update_idletasks()
 
 
-def quick_sort(arr):
+def quick_sort(arr, animations=None):
     """
     Performs Quick Sort on a copy of the array while recording
-    animation steps. Returns a list of operations.
+    animation steps. Returns a list of operations (or the given
+    animations, which only needs an append method).
     """
-    animations = []
+    if animations is None:
+        animations = []
     _quick_sort(arr, 0, len(arr) - 1, animations)
     return animations
 
 
 def _quick_sort(arr, low, high, animations):
-    if low < high:
-        # Mark the pivot element (chosen as the last element)
-        animations.append(("pivot", high))
-        pi = partition(arr, low, high, animations)
-        _quick_sort(arr, low, pi - 1, animations)
-        _quick_sort(arr, pi + 1, high, animations)
+    # An explicit stack instead of recursion: partitions full of duplicates
+    # are lopsided, which would nest one call per element. The left part is
+    # popped first, so the ops come in the same order as the recursive version.
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+        if low < high:
+            # Mark the pivot element (chosen as the last element)
+            animations.append(("pivot", high))
+            pi = partition(arr, low, high, animations)
+            stack.append((pi + 1, high))
+            stack.append((low, pi - 1))
 
 
 def partition(arr, low, high, animations):
@@ -0,0 +1,154 @@
+import argparse
+import random
+import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import quickgpt
+from opsgpt import apply_op
+from sortsgpt import SORTS
+
+# Race settings
+FRAME_DELAY = 20  # ms between frames of the shared render loop
+ARRAY_SIZE = quickgpt.ARRAY_SIZE  # the sort modules all draw this many bars
+MAX_VALUE = quickgpt.CANVAS_HEIGHT
+
+RACERS = ["quick_sort", "heap_sort", "merge_sort"]  # registered sorts raced by default
+
+# Which counter each recorded operation adds to
+COUNTERS = {"compare": "compares", "swap": "swaps", "overwrite": "writes"}
+
+
+class RacePanel:
+    def __init__(self, parent, title, module, generate):
+        self.title = title
+        self.module = module
+        self.generate = generate
+        self.label = tk.Label(parent, font=("Helvetica", 12))
+        self.canvas = tk.Canvas(parent, width=module.CANVAS_WIDTH, height=module.CANVAS_HEIGHT, bg="black")
+        self.future = None
+
+    def start(self, array, pool):
+        # Op generation runs in a worker process; the panel waits for it
+        if self.future is not None:
+            self.future.cancel()
+        self.array = list(array)
+        self.future = pool.submit(self.generate, list(array))
+        self.animations = None
+        self.error = None
+        self.index = 0
+        self.place = None
+        self.counts = dict.fromkeys(COUNTERS.values(), 0)
+        self.module.draw_array(self.canvas, self.array)
+        self.update_label()
+
+    @property
+    def done(self):
+        return self.place is not None or self.error is not None
+
+    def advance(self, ops_per_frame, finished):
+        """
+        Plays the next ops_per_frame operations, if they are ready.
+        Returns True once the panel has finished the race (or failed).
+        """
+        if self.done:
+            return True
+        if self.animations is None:
+            if not self.future.done():
+                return False
+            try:
+                self.animations = self.future.result()
+            except Exception as e:
+                # A failed worker (or a broken pool) only stops this panel
+                self.error = e
+                self.update_label()
+                return True
+
+        highlights = {}
+        for op in self.animations[self.index:self.index + ops_per_frame]:
+            apply_op(self.array, op, highlights)
+            if op[0] in COUNTERS:
+                self.counts[COUNTERS[op[0]]] += 1
+        self.index = min(self.index + ops_per_frame, len(self.animations))
+        if self.index == len(self.animations):
+            self.place = finished + 1
+            highlights = {}
+        self.module.draw_array(self.canvas, self.array, highlights)
+        self.update_label()
+        return self.place is not None
+
+    def update_label(self):
+        text = f"{self.title}   compares {self.counts['compares']}   swaps {self.counts['swaps']}" \
+               f"   writes {self.counts['writes']}"
+        if self.error is not None:
+            text += f"   failed: {type(self.error).__name__}: {self.error}"
+        elif self.place is not None:
+            text += f"   finished #{self.place} ({len(self.animations)} ops)"
+        elif self.animations is None:
+            text += "   (generating ops...)"
+        self.label.config(text=text)
+
+
+class SortRace:
+    def __init__(self, root, ops_per_frame=1, racers=RACERS):
+        self.root = root
+        self.ops_per_frame = ops_per_frame
+        root.title("Sort Race")
+        self.workers = len(racers)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        self.panels = []
+        for column, name in enumerate(racers):
+            sort = SORTS[name]
+            panel = RacePanel(root, sort.title, sort.module, sort.generate)
+            panel.label.grid(row=0, column=column)
+            panel.canvas.grid(row=1, column=column, padx=2)
+            self.panels.append(panel)
+
+        button = tk.Button(root, text="Race again", command=self.reset)
+        button.grid(row=2, column=0, columnspan=len(racers), pady=10)
+        root.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.reset()
+        self.render()
+
+    def reset(self):
+        # Every panel sorts the same random array
+        array = [random.randint(10, MAX_VALUE) for _ in range(ARRAY_SIZE)]
+        for panel in self.panels:
+            try:
+                panel.start(array, self.pool)
+            except BrokenProcessPool:
+                # A worker process died during the last race: start over with a new pool
+                self.pool.shutdown(wait=False)
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+                panel.start(array, self.pool)
+        self.finished = 0
+
+    def render(self):
+        # One render loop drives every panel at the same ops-per-frame rate
+        # (a panel that failed doesn't take a place)
+        for panel in self.panels:
+            if not panel.done and panel.advance(self.ops_per_frame, self.finished) and panel.error is None:
+                self.finished += 1
+        self.root.after(FRAME_DELAY, self.render)
+
+    def close(self):
+        for panel in self.panels:
+            panel.future.cancel()
+        self.pool.shutdown(wait=False)
+        self.root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Race sorting algorithms on the same array.")
+    parser.add_argument("--ops-per-frame", type=int, default=1, help="operations each panel plays per frame")
+    parser.add_argument("--sorts", nargs="+", choices=sorted(SORTS), default=RACERS, help="sorts to race")
+    args = parser.parse_args()
+    root = tk.Tk()
+    SortRace(root, args.ops_per_frame, args.sorts)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,15 @@ GAME_SPEED = 100  # delay in ms between moves
 
 
 class SnakeGame:
-    def __init__(self, master):
+    def __init__(self, master=None, canvas=None):
         self.master = master
+        self.after_id = None
+        if master is None:
+            # Headless game: no widgets or timers, advance it with step()
+            # (and draw it on the given canvas, if any, with draw())
+            self.canvas = canvas
+            self.reset_state()
+            return
         master.title("Snake Game")
 
         # Create canvas
@@ -29,7 +36,6 @@ class SnakeGame:
         master.bind("<Right>", self.on_key)
 
         # Initialize game state
-        self.after_id = None
         self.reset_game()
 
     def reset_game(self):
@@ -37,6 +43,11 @@ class SnakeGame:
         if self.after_id is not None:
             self.master.after_cancel(self.after_id)
 
+        self.reset_state()
+        self.draw()
+        self.after_id = self.master.after(GAME_SPEED, self.game_loop)
+
+    def reset_state(self):
         self.direction = (1, 0)  # initial direction: moving right
         # Start snake in the middle of the board
         start_x = BOARD_WIDTH // 2
@@ -44,8 +55,6 @@ class SnakeGame:
         self.snake = [(start_x, start_y)]
         self.place_food()
         self.game_over = False
-        self.draw()
-        self.after_id = self.master.after(GAME_SPEED, self.game_loop)
 
     def place_food(self):
         # Choose a random cell not occupied by the snake
@@ -75,6 +84,20 @@ class SnakeGame:
         if self.game_over:
             return
 
+        result = self.step()
+        if result == "You Win!":
+            self.draw()  # update drawing before showing win message
+            messagebox.showinfo("You Win!", "Congratulations, you filled the board!")
+        if result is not None:
+            self.end_game(result)
+            return
+
+        self.draw()
+        self.after_id = self.master.after(GAME_SPEED, self.game_loop)
+
+    def step(self):
+        # Move the snake one cell; returns the end-of-game message, if any
+
         # Calculate new head position
         head_x, head_y = self.snake[-1]
         dx, dy = self.direction
@@ -82,13 +105,11 @@ class SnakeGame:
 
         # Check for wall collision
         if not (0 <= new_head[0] < BOARD_WIDTH and 0 <= new_head[1] < BOARD_HEIGHT):
-            self.end_game("Game Over! You hit a wall!")
-            return
+            return "Game Over! You hit a wall!"
 
         # Check for collision with self
         if new_head in self.snake:
-            self.end_game("Game Over! You ran into yourself!")
-            return
+            return "Game Over! You ran into yourself!"
 
         # Add new head
         self.snake.append(new_head)
@@ -97,17 +118,12 @@ class SnakeGame:
         if new_head == self.food:
             # If the snake fills the board, it's a win!
             if len(self.snake) == BOARD_WIDTH * BOARD_HEIGHT:
-                self.draw()  # update drawing before showing win message
-                messagebox.showinfo("You Win!", "Congratulations, you filled the board!")
-                self.end_game("You Win!")
-                return
+                return "You Win!"
             self.place_food()  # place new food and keep the tail (grow snake)
         else:
             # Move snake forward: remove tail
             self.snake.pop(0)
-
-        self.draw()
-        self.after_id = self.master.after(GAME_SPEED, self.game_loop)
+        return None
 
     def draw(self):
         self.canvas.delete("all")
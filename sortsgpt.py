@@ -0,0 +1,360 @@
+import argparse
+import heapq
+import os
+import queue
+import random
+import threading
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import quickgpt
+import heapgpt
+import mergpt
+
+# Algorithm settings
+RADIX_BITS = 4  # bits per LSD radix digit (16 buckets)
+MIN_RUN = 32  # natural merge sort extends shorter runs to this length with insertion sort
+PARALLEL_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_CHUNK = 10000  # smaller inputs aren't worth a process pool
+STREAM_BATCH = 1000  # ops handed over from an OpStream's sort thread at a time
+STREAM_BATCHES = 64  # batches an OpStream buffers before its sort thread waits
+
+# Registry of op-emitting sorts: name -> Sort. generate(arr, animations=None)
+# sorts arr in place and returns its recorded operations ("compare", "swap",
+# "pivot" and "overwrite", as in the visualizers); the ops are appended to
+# animations if it is given (a list, or anything with append and extend).
+# title is the display name and module the sort module whose draw_array(),
+# ARRAY_SIZE and canvas size the visualizers use for it.
+Sort = namedtuple("Sort", "generate title module")
+SORTS = {}
+
+
+def register(name, title, module=quickgpt):
+    def decorator(generate):
+        SORTS[name] = Sort(generate, title, module)
+        return generate
+    return decorator
+
+
+def sort_table(make_view):
+    """
+    Returns a visualizer table {name: (view, width, height, bg)} with an
+    entry for every registered sort; make_view(module, generate) builds the view.
+    """
+    return {name: (make_view(sort.module, sort.generate), sort.module.CANVAS_WIDTH, sort.module.CANVAS_HEIGHT,
+                   "black")
+            for name, sort in SORTS.items()}
+
+
+register("quick_sort", "Quick Sort", quickgpt)(quickgpt.quick_sort)
+register("heap_sort", "Heap Sort", heapgpt)(heapgpt.heap_sort)
+register("merge_sort", "Merge Sort", mergpt)(mergpt.merge_sort_animations)
+
+
+@register("counting_sort", "Counting Sort")
+def counting_sort(arr, animations=None):
+    """
+    Counting Sort for integers: counts every value between the smallest
+    and the largest one, then writes the values back in order.
+    """
+    if animations is None:
+        animations = []
+    if not arr:
+        return animations
+    low = min(arr)
+    counts = [0] * (max(arr) - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+    k = 0
+    for offset, count in enumerate(counts):
+        for _ in range(count):
+            arr[k] = low + offset
+            animations.append(("overwrite", k, low + offset))
+            k += 1
+    return animations
+
+
+@register("radix_sort", "Radix Sort")
+def radix_sort(arr, animations=None):
+    """
+    LSD Radix Sort for integers: one stable bucket pass per RADIX_BITS-bit
+    digit, least significant first, each written back in full. The digits
+    are taken from value - min(arr), so negative values sort correctly too.
+    """
+    if animations is None:
+        animations = []
+    if not arr:
+        return animations
+    buckets = 1 << RADIX_BITS
+    mask = buckets - 1
+    low = min(arr)
+    largest = max(arr) - low
+    shift = 0
+    while largest >> shift:
+        counts = [0] * buckets
+        for value in arr:
+            counts[((value - low) >> shift) & mask] += 1
+        # Start position of every bucket in the output
+        positions = [0] * buckets
+        for digit in range(1, buckets):
+            positions[digit] = positions[digit - 1] + counts[digit - 1]
+        output = [0] * len(arr)
+        for value in arr:
+            digit = ((value - low) >> shift) & mask
+            output[positions[digit]] = value
+            positions[digit] += 1
+        for k, value in enumerate(output):
+            arr[k] = value
+            animations.append(("overwrite", k, value))
+        shift += RADIX_BITS
+    return animations
+
+
+@register("natural_merge_sort", "Natural Merge Sort")
+def natural_merge_sort(arr, animations=None):
+    """
+    Timsort-style natural Merge Sort: finds the runs already in the array
+    (reversing descending ones), extends short runs to MIN_RUN with
+    insertion sort and merges them with Timsort's run stack rules.
+    """
+    if animations is None:
+        animations = []
+    runs = []  # stack of (start, length)
+    start = 0
+    while start < len(arr):
+        end = find_run(arr, start, animations)
+        forced_end = min(start + MIN_RUN, len(arr))
+        if end < forced_end:
+            insertion_sort(arr, start, end, forced_end, animations)
+            end = forced_end
+        runs.append((start, end - start))
+        merge_collapse(arr, runs, animations)
+        start = end
+    while len(runs) > 1:
+        merge_at(arr, runs, len(runs) - 2, animations)
+    return animations
+
+
+def find_run(arr, start, animations):
+    # Returns the end of the run starting at start; a strictly descending
+    # run is reversed in place so every run ends up ascending.
+    end = start + 1
+    if end == len(arr):
+        return end
+    animations.append(("compare", end, end - 1))
+    descending = arr[end] < arr[end - 1]
+    end += 1
+    while end < len(arr):
+        animations.append(("compare", end, end - 1))
+        if (arr[end] < arr[end - 1]) != descending:
+            break
+        end += 1
+    if descending:
+        low, high = start, end - 1
+        while low < high:
+            animations.append(("swap", low, high))
+            arr[low], arr[high] = arr[high], arr[low]
+            low += 1
+            high -= 1
+    return end
+
+
+def insertion_sort(arr, low, sorted_end, end, animations):
+    # Insertion sort of arr[low:end], where arr[low:sorted_end] is already sorted
+    for i in range(sorted_end, end):
+        j = i
+        while j > low:
+            animations.append(("compare", j, j - 1))
+            if arr[j] >= arr[j - 1]:
+                break
+            animations.append(("swap", j, j - 1))
+            arr[j], arr[j - 1] = arr[j - 1], arr[j]
+            j -= 1
+
+
+def merge_collapse(arr, runs, animations):
+    # Merges runs on the stack until their lengths shrink fast enough
+    # toward the top, which keeps the merges balanced.
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(arr, runs, n, animations)
+
+
+def merge_at(arr, runs, i, animations):
+    # Merges the neighbouring runs i and i + 1 of the stack
+    start, length = runs[i]
+    next_length = runs[i + 1][1]
+    mergpt.merge(arr, start, start + length - 1, start + length + next_length - 1, animations)
+    runs[i] = (start, length + next_length)
+    del runs[i + 1]
+
+
+class Overwrites:
+    """
+    Records Merge Sort's ("overwrite", k, value) operations as two
+    array('i') columns, which go back from a worker process as a few
+    bytes an op instead of a pickled tuple each.
+    """
+
+    def __init__(self):
+        self.positions = array("i")
+        self.values = array("i")
+
+    def append(self, op):
+        self.positions.append(op[1])
+        self.values.append(op[2])
+
+
+def sort_chunk(chunk):
+    # Runs in a worker process
+    overwrites = Overwrites()
+    mergpt.merge_sort_animations(chunk, overwrites)
+    return array("i", chunk), overwrites
+
+
+@register("parallel_merge_sort", "Parallel Merge Sort")
+def parallel_merge_sort(arr, animations=None):
+    """
+    Merge Sort with the chunks sorted in a process pool (one per core),
+    then k-way merged. Each chunk's operations are shifted to the chunk's
+    place in the array and appended as soon as that chunk comes back, so
+    the ops of the first chunk can be played while the others are sorted.
+    """
+    if animations is None:
+        animations = []
+    chunks = max(1, min(PARALLEL_WORKERS, len(arr) // PARALLEL_MIN_CHUNK))
+    bounds = [len(arr) * i // chunks for i in range(chunks + 1)]
+    if chunks == 1:
+        return mergpt.merge_sort_animations(arr, animations)
+    parts = [arr[bounds[i]:bounds[i + 1]] for i in range(chunks)]
+    sorted_chunks = []
+    with ProcessPoolExecutor(max_workers=chunks) as pool:
+        # map() yields the chunks in order, each one as soon as it is sorted
+        for (chunk, overwrites), offset in zip(pool.map(sort_chunk, parts), bounds):
+            animations.extend(("overwrite", k + offset, value)
+                              for k, value in zip(overwrites.positions, overwrites.values))
+            sorted_chunks.append(chunk)
+            del overwrites  # not held while waiting for the next chunk
+
+    for k, value in enumerate(heapq.merge(*sorted_chunks)):
+        arr[k] = value
+        animations.append(("overwrite", k, value))
+    return animations
+
+
+class OpStream:
+    """
+    Runs a registered sort in a background thread and yields its operations
+    while they are being recorded, so playback can start right away and the
+    full op list (tens of millions of ops for very large arrays) is never held.
+    The sort thread waits once STREAM_BATCHES batches are waiting to be read.
+    """
+
+    class Closed(Exception):
+        pass
+
+    def __init__(self, sort, arr, batch=STREAM_BATCH, batches=STREAM_BATCHES):
+        self.batch_size = batch
+        self.batch = []
+        self.queue = queue.Queue(maxsize=batches)
+        self.closed = False
+        threading.Thread(target=self.run, args=(sort, arr), daemon=True).start()
+
+    def append(self, op):
+        self.batch.append(op)
+        if len(self.batch) == self.batch_size:
+            if self.closed:
+                raise OpStream.Closed
+            self.queue.put(self.batch)
+            self.batch = []
+
+    def extend(self, ops):
+        for op in ops:
+            self.append(op)
+
+    def run(self, sort, arr):
+        try:
+            sort(arr, self)
+        except OpStream.Closed:
+            return
+        except Exception as e:
+            self.queue.put(e)
+            return
+        self.queue.put(self.batch)
+        self.queue.put(None)
+
+    def close(self):
+        # Stops the sort thread at its next batch; emptying the queue
+        # wakes it up if it is waiting for room
+        self.closed = True
+        try:
+            while True:
+                self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __iter__(self):
+        while not self.closed:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            if isinstance(batch, Exception):
+                raise batch
+            yield from batch
+
+
+def time_sort(name, values):
+    # Returns the op count, the seconds taken and whether the result is sorted
+    arr = list(values)
+    start = time.perf_counter()
+    animations = SORTS[name].generate(arr)
+    elapsed = time.perf_counter() - start
+    return len(animations), elapsed, arr == sorted(values)
+
+
+def main():
+    global PARALLEL_WORKERS
+    parser = argparse.ArgumentParser(description="Time every registered sort's op generation on one large input.")
+    parser.add_argument("--size", type=int, default=50000, help="number of elements")
+    parser.add_argument("--max-value", type=int, default=quickgpt.CANVAS_HEIGHT, help="largest value")
+    parser.add_argument("--only", nargs="+", choices=sorted(SORTS), help="only time these sorts")
+    args = parser.parse_args()
+
+    values = [random.randint(10, args.max_value) for _ in range(args.size)]
+    names = args.only or list(SORTS)
+    for name in names:
+        ops, elapsed, ok = time_sort(name, values)
+        status = "ok" if ok else "NOT SORTED"
+        print(f"{name:<20} {ops:>11} ops {elapsed:>8.2f}s {args.size / elapsed:>12.0f} elements/s  {status}")
+
+    if "parallel_merge_sort" in names:
+        # Its gap over merge_sort depends on the cores it gets: time it with
+        # 1, 2, 4... workers (1 worker is plain merge_sort), up to this machine's cores
+        cores = PARALLEL_WORKERS
+        counts = [1]
+        while counts[-1] * 2 < max(2, cores):
+            counts.append(counts[-1] * 2)
+        counts.append(max(2, cores))
+        print(f"\nparallel_merge_sort by worker count ({os.cpu_count()} core(s) here, "
+              f"chunks of at least {PARALLEL_MIN_CHUNK} elements):")
+        single = None
+        for workers in counts:
+            PARALLEL_WORKERS = workers
+            ops, elapsed, ok = time_sort("parallel_merge_sort", values)
+            single = single or elapsed
+            status = "ok" if ok else "NOT SORTED"
+            print(f"{workers:>3} workers {elapsed:>8.2f}s {args.size / elapsed:>12.0f} elements/s "
+                  f"{single / elapsed:>6.2f}x  {status}")
+        PARALLEL_WORKERS = cores
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import argparse
+import csv
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import hexagpt
+
+# Sweep settings
+STEPS = 3000  # frames simulated per configuration
+REST_SPEED = 0.5  # the ball counts as resting below this speed (pixels per frame)
+REST_FRAMES = 50  # ... once it has stayed that slow for this many frames
+PARQUET_BATCH = 256  # rows per Parquet row group
+
+# hexagpt parameters that can be swept, and the grid used when none is given
+PARAMETERS = ("GRAVITY", "FRICTION", "RESTITUTION", "hex_angular_velocity",
+              "BALL_RADIUS", "HEX_RADIUS", "HEX_SIDES")
+DEFAULT_GRID = {
+    "GRAVITY": [0.25, 0.5, 1.0],
+    "FRICTION": [0.98, 0.99, 0.999],
+    "RESTITUTION": [0.7, 0.9, 1.0],
+    "hex_angular_velocity": [0.0, 0.02, 0.05],
+}
+METRICS = ("bounces", "energy_ratio", "time_to_rest", "time_to_escape", "seconds")
+INT_FIELDS = ("HEX_SIDES", "bounces", "time_to_rest", "time_to_escape")
+
+
+def energy():
+    # Kinetic plus potential energy of the ball (per unit mass, y grows downward)
+    return 0.5 * (hexagpt.ball_vx ** 2 + hexagpt.ball_vy ** 2) + hexagpt.GRAVITY * (hexagpt.HEIGHT - hexagpt.ball_y)
+
+
+def inside(vertices, x, y):
+    # True if (x, y) is inside the convex polygon
+    signs = set()
+    for i in range(len(vertices)):
+        x1, y1 = vertices[i]
+        x2, y2 = vertices[(i + 1) % len(vertices)]
+        cross = (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1)
+        if cross != 0:
+            signs.add(cross > 0)
+    return len(signs) < 2
+
+
+def run_config(config, steps):
+    """
+    Runs the hexagon simulation headless with the given parameter values
+    for up to the given number of steps and returns its metrics.
+    Runs in a worker process, so changing hexagpt's globals is safe.
+    """
+    start = time.perf_counter()
+    for name, value in config.items():
+        setattr(hexagpt, name, value)
+    hexagpt.set_container(hexagpt.regular_polygon(hexagpt.HEX_SIDES, hexagpt.HEX_RADIUS))
+    hexagpt.reset_state()
+
+    initial_energy = energy()
+    time_to_rest = None
+    time_to_escape = None
+    slow_frames = 0
+    for frame in range(1, steps + 1):
+        vertices = hexagpt.step()
+        if not inside(vertices, hexagpt.ball_x, hexagpt.ball_y):
+            time_to_escape = frame
+            break
+        if math.hypot(hexagpt.ball_vx, hexagpt.ball_vy) < REST_SPEED:
+            slow_frames += 1
+            if slow_frames == REST_FRAMES and time_to_rest is None:
+                time_to_rest = frame - REST_FRAMES + 1
+        else:
+            slow_frames = 0
+
+    row = dict(config)
+    row["bounces"] = hexagpt.bounce_count
+    row["energy_ratio"] = energy() / initial_energy if initial_energy else None
+    row["time_to_rest"] = time_to_rest
+    row["time_to_escape"] = time_to_escape
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def grid_configs(grid):
+    # Every combination of the grid's values, as {parameter: value} dicts
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+class CsvSink:
+    def __init__(self, path, fields):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=fields)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    # Needs pyarrow; rows are written in row groups of PARQUET_BATCH
+    def __init__(self, path, fields):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit("Writing Parquet needs pyarrow (pip install pyarrow), or use a .csv output")
+        self.pyarrow = pyarrow
+        self.path = path
+        self.schema = pyarrow.schema([(name, pyarrow.int64() if name in INT_FIELDS else pyarrow.float64())
+                                      for name in fields])
+        self.rows = []
+        self.writer = None
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        table = self.pyarrow.Table.from_pylist(self.rows, schema=self.schema)
+        if self.writer is None:
+            self.writer = self.pyarrow.parquet.ParquetWriter(self.path, self.schema)
+        self.writer.write_table(table)
+        self.rows = []
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+
+
+def parse_grid(items):
+    # ["GRAVITY=0.3,0.5", ...] -> {"GRAVITY": [0.3, 0.5], ...}
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in PARAMETERS:
+            raise SystemExit(f"Unknown parameter {name!r}, choose from: {', '.join(PARAMETERS)}")
+        cast = int if name == "HEX_SIDES" else float
+        grid[name] = [cast(value) for value in values.split(",")]
+    return grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the hexagon physics parameters across all cores.")
+    parser.add_argument("grid", nargs="*", metavar="NAME=V1,V2,...",
+                        help=f"parameter values to sweep (default: a small grid over {', '.join(DEFAULT_GRID)})")
+    parser.add_argument("--steps", type=int, default=STEPS, help="frames simulated per configuration")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--output", default="sweep.csv", help="results file (.csv or .parquet)")
+    args = parser.parse_args()
+
+    grid = parse_grid(args.grid) if args.grid else DEFAULT_GRID
+    configs = grid_configs(grid)
+    fields = list(grid) + list(METRICS)
+    sink = (ParquetSink if args.output.endswith(".parquet") else CsvSink)(args.output, fields)
+
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(run_config, config, args.steps) for config in configs]
+            # Results are written as soon as each configuration finishes
+            for done, future in enumerate(as_completed(futures), 1):
+                sink.write(future.result())
+                print(f"\r{done}/{len(configs)} configurations", end="", flush=True)
+    finally:
+        sink.close()
+    print(f"\nWrote {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
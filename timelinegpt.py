@@ -0,0 +1,252 @@
+import argparse
+import random
+import threading
+import tkinter as tk
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # only needed for arrays drawn with BarImage
+    np = None
+
+import quickgpt
+from bargpt import BarImage
+from opsgpt import apply_op
+from sortsgpt import SORTS
+
+# Timeline settings
+CHECKPOINT_INTERVAL = 1000  # ops between two snapshots; a seek replays at most this many ops
+SNAPSHOT_BUDGET = 64 * 1024 * 1024  # bytes of snapshots kept; past it the interval doubles
+BUILD_POLL = 50  # ms between checks whether the timeline is built
+OPS_PER_FRAME = 1  # ops played per frame while playing
+DELAY = 1  # ms between frames while playing
+
+
+# Op kinds as stored in Timeline.kinds
+KINDS = ("compare", "swap", "pivot", "overwrite")
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+
+class Timeline:
+    """
+    A recorded sort that can be played forward or sought to any op.
+    The ops are kept in three parallel arrays (kind code, first and second
+    operand), about 9 bytes an op instead of a tuple each. Every interval ops
+    a snapshot of the array is kept as a compact array('H'), so seeking
+    restores the nearest snapshot before the target and replays at most
+    interval ops from there. When the snapshots would go past budget bytes,
+    every other one is dropped and the interval doubles.
+    The current array is always self.array (also an array('H'), updated in place).
+
+    record() fills the timeline: the sort appends its ops straight into it.
+    """
+
+    class Cancelled(Exception):
+        pass
+
+    def __init__(self, values, interval=CHECKPOINT_INTERVAL, budget=SNAPSHOT_BUDGET):
+        self.kinds = array("B")
+        self.firsts = array("i")
+        self.seconds = array("i")
+        self.interval = interval
+        self.array = array("H", values)
+        self.checkpoints = [array("H", values)]
+        self.max_checkpoints = max(2, budget // max(1, len(values) * self.array.itemsize))
+        self.position = 0  # ops applied so far
+        self.cancelled = False
+        self.done = False
+        self.error = None
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def append(self, op):
+        # Records one op and applies it, to take the snapshots in the same pass
+        if len(self.kinds) == len(self.checkpoints) * self.interval:
+            if self.cancelled:
+                raise Timeline.Cancelled
+            self.checkpoints.append(array("H", self.array))
+            if len(self.checkpoints) > self.max_checkpoints:
+                del self.checkpoints[1::2]
+                self.interval *= 2
+        kind = KIND_CODES[op[0]]
+        self.kinds.append(kind)
+        self.firsts.append(op[1])
+        self.seconds.append(op[2] if len(op) > 2 else 0)
+        if op[0] == "swap":
+            self.array[op[1]], self.array[op[2]] = self.array[op[2]], self.array[op[1]]
+        elif op[0] == "overwrite":
+            self.array[op[1]] = op[2]
+
+    def extend(self, ops):
+        for op in ops:
+            self.append(op)
+
+    def record(self, generate):
+        """
+        Records generate's ops, then goes back to the start. Can run in a
+        background thread: done is set at the end, with error set if the sort
+        failed. Setting cancelled stops the recording at the next snapshot.
+        """
+        try:
+            generate(list(self.checkpoints[0]), self)
+        except Timeline.Cancelled:
+            return
+        except Exception as e:
+            self.error = e
+        self.array[:] = self.checkpoints[0]
+        self.done = True
+
+    def op(self, index):
+        return KINDS[self.kinds[index]], self.firsts[index], self.seconds[index]
+
+    def step(self, count=1):
+        """
+        Applies the next count ops and returns their highlights.
+        """
+        highlights = {}
+        end = min(self.position + count, len(self))
+        for index in range(self.position, end):
+            apply_op(self.array, self.op(index), highlights)
+        self.position = end
+        return highlights
+
+    def seek(self, position):
+        """
+        Moves to the state after the first position ops and returns
+        the highlights of the last op applied.
+        """
+        position = max(0, min(position, len(self)))
+        if not self.position <= position < self.position + self.interval:
+            # Only go back to a snapshot if replaying from here would be longer; it is
+            # the one before the last op, so that op is replayed for its highlight
+            checkpoint = min(max(position - 1, 0) // self.interval, len(self.checkpoints) - 1)
+            self.array[:] = self.checkpoints[checkpoint]
+            self.position = checkpoint * self.interval
+        highlights = {}
+        if position > self.position:
+            self.step(position - 1 - self.position)
+            highlights = self.step(1)
+        return highlights
+
+
+class TimelineVisualizer:
+    def __init__(self, root, algorithm, size=quickgpt.ARRAY_SIZE, interval=CHECKPOINT_INTERVAL,
+                 ops_per_frame=OPS_PER_FRAME):
+        self.root = root
+        self.algorithm = algorithm
+        self.size = size
+        self.interval = interval
+        self.ops_per_frame = ops_per_frame
+        root.title(f"{algorithm} timeline")
+
+        self.canvas = tk.Canvas(root, width=quickgpt.CANVAS_WIDTH, height=quickgpt.CANVAS_HEIGHT, bg="black",
+                                highlightthickness=0)
+        self.canvas.pack()
+        # draw_array() is made for ARRAY_SIZE bars; any other size is drawn into an image
+        self.bars = BarImage(self.canvas, size) if size != quickgpt.ARRAY_SIZE else None
+        # Dragging the scrubber seeks; playing moves it along
+        self.scrubber = tk.Scale(root, orient="horizontal", length=quickgpt.CANVAS_WIDTH, command=self.on_scrub)
+        self.scrubber.pack()
+        controls = tk.Frame(root)
+        controls.pack(pady=10)
+        self.play_button = tk.Button(controls, text="Play", command=self.toggle_play)
+        self.play_button.pack(side="left", padx=5)
+        tk.Button(controls, text="Reset", command=self.reset).pack(side="left", padx=5)
+
+        self.after_id = None
+        self.timeline = None
+        self.building = None
+        self.build_id = None
+        self.reset()
+
+    def reset(self):
+        # The timeline is recorded in a background thread (large sorts take
+        # seconds); the window shows the unsorted array and stays responsive
+        self.pause()
+        if self.building is not None:
+            self.building.cancelled = True
+            self.root.after_cancel(self.build_id)
+        values = [random.randint(10, quickgpt.CANVAS_HEIGHT) for _ in range(self.size)]
+        self.timeline = None
+        self.building = Timeline(values, self.interval)
+        threading.Thread(target=self.building.record, args=(SORTS[self.algorithm].generate,), daemon=True).start()
+        self.root.title(f"{self.algorithm} timeline (recording...)")
+        self.scrubber.config(from_=0, to=0)
+        if self.bars is not None:
+            self.bars.draw(np.array(values, dtype=np.uint16))
+        else:
+            quickgpt.draw_array(self.canvas, values)
+        self.build_id = self.root.after(BUILD_POLL, self.wait_for_build)
+
+    def wait_for_build(self):
+        if not self.building.done:
+            self.build_id = self.root.after(BUILD_POLL, self.wait_for_build)
+            return
+        self.timeline, self.building, self.build_id = self.building, None, None
+        if self.timeline.error is not None:
+            self.root.title(f"{self.algorithm} timeline (failed: {self.timeline.error})")
+        else:
+            self.root.title(f"{self.algorithm} timeline ({len(self.timeline)} ops)")
+        if self.bars is not None:
+            # A view of the timeline's array, which is only ever updated in place
+            self.values = np.frombuffer(self.timeline.array, dtype=np.uint16)
+        self.scrubber.config(from_=0, to=len(self.timeline))
+        self.scrubber.set(0)
+        self.draw()
+
+    def draw(self, highlights=None, changed=None):
+        # changed lists the indices that may differ from the last draw (None = all)
+        if self.bars is not None:
+            self.bars.draw(self.values, highlights, changed)
+        else:
+            quickgpt.draw_array(self.canvas, self.timeline.array, highlights or {})
+
+    def on_scrub(self, value):
+        position = int(float(value))
+        if self.timeline is not None and position != self.timeline.position:
+            self.draw(self.timeline.seek(position))
+
+    def toggle_play(self):
+        if self.timeline is None:
+            return
+        if self.after_id is None:
+            self.play_button.config(text="Pause")
+            self.play()
+        else:
+            self.pause()
+
+    def pause(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.play_button.config(text="Play")
+
+    def play(self):
+        if self.timeline.position >= len(self.timeline):
+            self.draw(changed=())
+            self.after_id = None
+            self.play_button.config(text="Play")
+            return
+        highlights = self.timeline.step(self.ops_per_frame)
+        self.scrubber.set(self.timeline.position)
+        # Every index an op touched is highlighted, so the highlights are the changes too
+        self.draw(highlights, highlights.keys())
+        self.after_id = self.root.after(DELAY, self.play)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sort visualizer with a timeline you can scrub through.")
+    parser.add_argument("algorithm", choices=sorted(SORTS))
+    parser.add_argument("--size", type=int, default=quickgpt.ARRAY_SIZE,
+                        help="number of elements (other sizes than the default need NumPy)")
+    parser.add_argument("--interval", type=int, default=CHECKPOINT_INTERVAL, help="ops between snapshots")
+    parser.add_argument("--ops-per-frame", type=int, default=OPS_PER_FRAME, help="ops played per frame")
+    args = parser.parse_args()
+    root = tk.Tk()
+    TimelineVisualizer(root, args.algorithm, args.size, args.interval, args.ops_per_frame)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
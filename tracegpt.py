@@ -0,0 +1,277 @@
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+import hexagpt
+import ponggpt
+import snakegpt
+import cubegpt
+import quickgpt
+from sortsgpt import SORTS
+
+# Trace settings
+FRAMES = 200  # frames recorded per simulation
+PLACES = 6  # floats are rounded to this many decimal places before hashing
+SEED = 1234  # seed for every random choice made during a trace
+SORT_ARRAY_SIZE = 200
+SORT_OPS_PER_FRAME = 25  # recorded sort operations applied per frame
+THROUGHPUT_RUNS = 5  # throughput is the best of this many runs, to smooth out noise
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_traces.json")
+# The full per-frame states behind the hashes, to compare with a tolerance when a hash differs
+STATES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden_states.json.gz")
+
+
+def trace_hexagon(frames):
+    hexagpt.reset_state()
+    for _ in range(frames):
+        hexagpt.step()
+        yield (hexagpt.ball_x, hexagpt.ball_y, hexagpt.ball_vx, hexagpt.ball_vy, hexagpt.hex_angle)
+
+
+def trace_pong(frames):
+    random.seed(SEED)
+    game = ponggpt.PongGame()
+    for frame in range(frames):
+        # Scripted player: holds the key toward the ball for half of every six frames
+        if frame % 6 == 0:
+            if game.ball_y + ponggpt.BALL_SIZE / 2 < game.player_y + ponggpt.PADDLE_HEIGHT / 2:
+                game.key_down(SimpleNamespace(keysym="Up"))
+            else:
+                game.key_down(SimpleNamespace(keysym="Down"))
+        elif frame % 6 == 3:
+            game.key_up(SimpleNamespace(keysym="Up"))
+            game.key_up(SimpleNamespace(keysym="Down"))
+        game.step()
+        yield (game.ball_x, game.ball_y, game.ball_dx, game.ball_dy,
+               game.player_y, game.ai_y, game.player_score, game.ai_score)
+
+
+def snake_autopilot(game):
+    """
+    Picks the key that brings the snake closest to the food
+    without hitting a wall or itself.
+    """
+    if game.food is None:
+        return
+    head_x, head_y = game.snake[-1]
+    food_x, food_y = game.food
+    best = None
+    for key, (dx, dy) in (("Up", (0, -1)), ("Down", (0, 1)), ("Left", (-1, 0)), ("Right", (1, 0))):
+        x, y = head_x + dx, head_y + dy
+        if not (0 <= x < snakegpt.BOARD_WIDTH and 0 <= y < snakegpt.BOARD_HEIGHT) or (x, y) in game.snake:
+            continue
+        distance = abs(food_x - x) + abs(food_y - y)
+        if best is None or distance < best[0]:
+            best = (distance, key)
+    if best is not None:
+        game.on_key(SimpleNamespace(keysym=best[1]))
+
+
+def trace_snake(frames):
+    random.seed(SEED)
+    game = snakegpt.SnakeGame()
+    games = 0
+    for _ in range(frames):
+        snake_autopilot(game)
+        if game.step() is not None:
+            games += 1
+            game.reset_state()
+        yield (tuple(game.snake), game.food, game.direction, games)
+
+
+def trace_cube(frames):
+    cube = cubegpt.Cube3D()
+    for _ in range(frames):
+        cube.rotate()
+        vertices = cube.get_rotated_vertices()
+        yield (vertices, [cube.project(x, y, z) for x, y, z in vertices])
+
+
+def sort_trace(generate):
+    def trace(frames):
+        rng = random.Random(SEED)
+        array = [rng.randint(10, quickgpt.CANVAS_HEIGHT) for _ in range(SORT_ARRAY_SIZE)]
+        animations = generate(list(array))
+        for frame in range(frames):
+            ops = animations[frame * SORT_OPS_PER_FRAME:(frame + 1) * SORT_OPS_PER_FRAME]
+            if not ops:
+                return
+            # Apply the ops the same way the visualizers' animate() does
+            for op in ops:
+                if op[0] == "swap":
+                    array[op[1]], array[op[2]] = array[op[2]], array[op[1]]
+                elif op[0] == "overwrite":
+                    array[op[1]] = op[2]
+            yield (ops, array)
+    return trace
+
+
+TRACES = {
+    "hexagon": trace_hexagon,
+    "pong": trace_pong,
+    "snake": trace_snake,
+    "cube": trace_cube,
+    **{name: sort_trace(sort.generate) for name, sort in SORTS.items()},
+}
+
+
+def quantize(value, places):
+    """
+    Rounds every number inside a (nested) state to the given number of
+    decimal places before hashing. Values either side of a rounding boundary
+    still hash differently, so a hash mismatch is checked with states_close().
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Ints become floats too, so 4 and 4.0 hash the same; + 0.0 turns -0.0 into 0.0
+        return round(float(value), places) + 0.0
+    if isinstance(value, (list, tuple)):
+        return tuple(quantize(v, places) for v in value)
+    return value
+
+
+def frame_hash(state, places):
+    return hashlib.blake2b(repr(quantize(state, places)).encode(), digest_size=4).hexdigest()
+
+
+def plain(state):
+    # The state as JSON data (tuples become lists), copied so that
+    # later frames updating it in place can't change it
+    if isinstance(state, (list, tuple)):
+        return [plain(value) for value in state]
+    return state
+
+
+def states_close(a, b, tolerance):
+    """
+    Compares two plain states; numbers may differ by up to tolerance.
+    """
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(states_close(x, y, tolerance) for x, y in zip(a, b))
+    numbers = (int, float)
+    if isinstance(a, numbers) and isinstance(b, numbers) and not isinstance(a, bool) and not isinstance(b, bool):
+        return math.isclose(a, b, rel_tol=0, abs_tol=tolerance)
+    return a == b
+
+
+def record_trace(name, frames, places):
+    # Returns the frame hashes and the plain states they were taken from
+    hashes = []
+    states = []
+    for state in TRACES[name](frames):
+        hashes.append(frame_hash(state, places))
+        states.append(plain(state))
+    return hashes, states
+
+
+def compare_trace(trace, states, expected, expected_states, places):
+    """
+    Returns None if the trace matches the golden one, else the first frame
+    that differs. Frames whose hashes differ still match if their recorded
+    states are within 10 ** -places of each other.
+    """
+    if trace == expected:
+        return None
+    for frame, (a, b) in enumerate(zip(trace, expected)):
+        if a != b and (expected_states is None or
+                       not states_close(states[frame], expected_states[frame], 10 ** -places)):
+            return frame
+    if len(trace) != len(expected):
+        return min(len(trace), len(expected))
+    return None
+
+
+def measure_throughput(name, frames, runs=THROUGHPUT_RUNS):
+    # Steps per second of the bare simulation, without any hashing
+    best = 0.0
+    for _ in range(runs):
+        start = time.perf_counter()
+        steps = sum(1 for _ in TRACES[name](frames))
+        elapsed = time.perf_counter() - start
+        best = max(best, steps / elapsed if elapsed > 0 else float("inf"))
+    return best
+
+
+def load_states():
+    if not os.path.exists(STATES_FILE):
+        return {}
+    with gzip.open(STATES_FILE, "rb") as f:
+        return json.loads(f.read().decode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the simulations against their golden frame traces.")
+    parser.add_argument("--record", action="store_true", help="re-record the golden traces")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="frames per simulation when recording")
+    parser.add_argument("--places", type=int, default=PLACES, help="float tolerance (decimal places) when recording")
+    parser.add_argument("--only", nargs="+", choices=sorted(TRACES), help="only run these simulations")
+    args = parser.parse_args()
+    names = args.only or list(TRACES)
+
+    golden_states = {} if args.record else None
+    if args.record:
+        golden = {"frames": args.frames, "places": args.places, "traces": {}, "throughput": {}}
+        if os.path.exists(GOLDEN_FILE):
+            with open(GOLDEN_FILE) as f:
+                previous = json.load(f)
+            # Keep the other simulations' traces if they were recorded with the same settings
+            if previous["frames"] == args.frames and previous["places"] == args.places:
+                golden["traces"] = previous["traces"]
+                golden["throughput"] = previous.get("throughput", {})
+                golden_states = load_states()
+    else:
+        with open(GOLDEN_FILE) as f:
+            golden = json.load(f)
+
+    failures = 0
+    for name in names:
+        trace, states = record_trace(name, golden["frames"], golden["places"])
+        if args.record:
+            golden["traces"][name] = trace
+            golden_states[name] = states
+            status = "recorded"
+        else:
+            expected = golden["traces"][name]
+            if trace == expected:
+                status = "ok"
+            else:
+                # Only read the (large) states file when a hash differs
+                if golden_states is None:
+                    golden_states = load_states()
+                frame = compare_trace(trace, states, expected, golden_states.get(name), golden["places"])
+                if frame is None:
+                    status = "ok (within tolerance)"
+                else:
+                    failures += 1
+                    status = f"MISMATCH at frame {frame} ({len(trace)} frames, expected {len(expected)})"
+        steps_per_second = measure_throughput(name, golden["frames"])
+        # The recorded throughput is a baseline to compare against, never a failure:
+        # timings vary between machines and runs
+        baseline = golden.get("throughput", {}).get(name)
+        if args.record:
+            golden["throughput"][name] = round(steps_per_second)
+            change = ""
+        elif baseline:
+            change = f" ({(steps_per_second / baseline - 1) * 100:+5.0f}% vs recorded)"
+        else:
+            change = " (no recorded baseline)"
+        print(f"{name:<19} {steps_per_second:>12.0f} steps/s{change}  {status}")
+
+    if args.record:
+        with open(GOLDEN_FILE, "w") as f:
+            json.dump(golden, f, indent=1)
+            f.write("\n")
+        # mtime=0 keeps the file identical when the states don't change
+        with gzip.GzipFile(STATES_FILE, "wb", mtime=0) as f:
+            f.write(json.dumps(golden_states, separators=(",", ":")).encode())
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()